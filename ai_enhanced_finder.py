@@ -5,87 +5,544 @@ Uses Claude API to filter and classify old movies from Vimeo
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
+import hashlib
 import json
+import math
 import os
-from typing import List, Dict
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Broad search queries, run concurrently and deduplicated by URL
+SEARCH_QUERIES = (
+    # Era-based
+    "1920s movies",
+    "1930s movies",
+    "1940s movies",
+    "1950s movies",
+    "1960s movies",
+    # Style-based
+    "classic films",
+    "silent movies",
+    "silent films",
+    "vintage cinema",
+    "old movies",
+    "black and white films",
+    # Genre-based
+    "old horror movies",
+    "film noir",
+    "classic western",
+    "vintage comedy",
+    "old sci-fi films",
+    # General
+    "public domain films",
+    "classic hollywood",
+    "golden age cinema"
+)
+
+# CSV schema: fields collected from Vimeo, plus those added by Claude
+VIDEO_FIELDS = ("title", "url", "description", "duration", "created_time", "views", "user",
+                "source_query")
+AI_FIELDS = ("is_old_movie", "estimated_era", "genre", "relevance_score")
+
+# Static instructions sent as a cached system prompt with every batch.
+# Anthropic only caches prompt prefixes of at least 1024 tokens, so the
+# rubric is spelled out in full rather than kept to a few lines.
+CLASSIFICATION_INSTRUCTIONS = """You classify Vimeo videos for people searching for old and classic movies.
+
+The user message is a JSON array of videos. Each video has:
+- title: the video title as uploaded to Vimeo
+- description: the first 300 characters of the video description
+- year: the year the video was UPLOADED to Vimeo (not the year the film was made)
+
+Analyze the videos and determine which are genuinely old/classic films (pre-1970) or compilations/restorations of old film content.
+For each video, provide:
+- is_old_movie: true/false (is this actually a classic/old film or restoration/compilation of old film footage?)
+- estimated_era: decade like "1920s", "1940s", or "modern" (based on the FILM CONTENT, not upload date)
+- genre: primary genre (horror, comedy, drama, western, sci-fi, etc.)
+- relevance_score: 1-10 (how relevant is this to someone searching for old movies? Give higher scores to actual old film content, restorations, and compilations)
+
+How to judge is_old_movie:
+- TRUE for films produced before 1970, whether uploaded as a full feature, a short, a reel, or a restoration
+- TRUE for compilations, remasters, colorizations, and restorations made from pre-1970 film footage
+- TRUE for silent films, early sound films, newsreels, and early animation when the footage itself is old
+- FALSE for modern films shot to look old (black and white student films, "vintage style" music videos, pastiches)
+- FALSE for trailers of modern films, video essays, reviews, reaction videos, and lectures about old movies
+- FALSE for modern amateur shorts, showreels, commercials, and promos, even if they mention classic films
+- When the title names a well-known classic (e.g. "Nosferatu", "Metropolis", "The General", "His Girl Friday"), assume the upload is that film unless the description clearly says otherwise
+
+How to judge estimated_era:
+- Use the decade the FILM CONTENT was produced in: "1890s", "1900s", "1910s", "1920s", "1930s", "1940s", "1950s", "1960s"
+- Use "1970s" or "1980s" for films from those decades, and "modern" for anything from 1990 onwards
+- Years in the title or description ("Sherlock Jr. (1924)") are strong evidence; the upload year is NOT evidence of the production era
+- Era descriptors are useful hints: "silent era" suggests 1910s-1920s, "pre-code" suggests 1930-1934, "golden age" suggests 1930s-1950s, "technicolor" suggests 1940s-1950s
+- Actor and director names indicate era: Chaplin, Keaton, Lloyd, Murnau, and Griffith suggest the 1910s-1920s; Bogart, Hitchcock, Capra, and Welles suggest the 1930s-1950s
+- If there is no evidence either way, pick the most plausible decade for the described content
+
+Genre taxonomy (pick the single best fit, lowercase):
+- comedy: slapstick, screwball, silent comedy, comedy shorts
+- drama: melodrama, social drama, literary adaptations
+- horror: gothic horror, monster movies, expressionist horror
+- sci-fi: science fiction, space adventure, atomic-age creature features
+- western: frontier stories, cowboys, cavalry, outlaws
+- noir: film noir, hardboiled detective stories, neo-noir
+- crime: gangster films, heist films, police procedurals
+- thriller: suspense, espionage, mystery
+- romance: romantic dramas and romantic comedies
+- musical: musicals, revues, dance films
+- war: war films, wartime propaganda features
+- adventure: swashbucklers, jungle adventures, serials
+- animation: cartoons and animated shorts
+- documentary: documentaries, newsreels, travelogues, educational films
+- experimental: avant-garde and abstract film
+- other: anything that does not fit the categories above
+
+How to score relevance_score (1-10):
+- 9-10: a complete classic film, short, or restoration of one, clearly pre-1970
+- 7-8: probably a classic film or a substantial compilation/restoration of old footage
+- 5-6: old footage of uncertain origin, or partial content such as long excerpts
+- 3-4: content about old movies that is not itself old footage (essays, tributes, reviews)
+- 1-2: modern content unrelated to old movies
+
+Respond with ONLY a JSON array of objects, one per video, in the same order as the input.
+Do not include any text before or after the JSON array.
+Example format:
+[
+  {"is_old_movie": true, "estimated_era": "1920s", "genre": "comedy", "relevance_score": 9},
+  {"is_old_movie": false, "estimated_era": "modern", "genre": "documentary", "relevance_score": 3}
+]"""
+
 class AIEnhancedMovieFinder:
-    def __init__(self, vimeo_token: str = None, claude_api_key: str = None):
+    def __init__(self, vimeo_token: str = None, claude_api_key: str = None,
+                 cache_path: Optional[str] = os.path.join("outputs", ".ai_enhanced_cache.db")):
         """
         Initialize with API tokens
         
         Args:
             vimeo_token: Vimeo API token
             claude_api_key: Anthropic Claude API key (optional)
+            cache_path: SQLite file used to cache Claude classifications and
+                Vimeo search pages across runs (None disables the cache)
         """
         self.vimeo_token = vimeo_token
         self.claude_api_key = claude_api_key
         self.vimeo_base_url = "https://api.vimeo.com"
         self.claude_base_url = "https://api.anthropic.com/v1/messages"
+        self.claude_model = "claude-sonnet-4-20250514"
+        # (connect, read) timeouts in seconds; Claude gets longer to generate
+        # a full batch. Timed-out calls are retried by the session.
+        self.vimeo_timeout = (5, 30)
+        self.claude_timeout = (5, 60)
+        self._cache = self._open_cache(cache_path) if cache_path else None
+        # Searches run on worker threads, so cache access is serialized
+        self._cache_lock = threading.Lock()
+
+        # Per-API headers are built once; they stay off the session defaults
+        # so the Vimeo token is never sent to Anthropic and vice versa.
+        self.vimeo_headers = {
+            "Authorization": f"Bearer {vimeo_token}",
+            "Accept": "application/vnd.vimeo.*+json;version=3.4"
+        }
+        self.claude_headers = {
+            "x-api-key": claude_api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        }
+
+        # One pooled session for every request: keep-alive connections are
+        # reused across pages, queries and batches instead of paying a new
+        # TCP + TLS handshake per call. Rate limits and server errors are
+        # retried with exponential backoff, honouring Retry-After.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504, 529],
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True
+        )
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        )
+
+    @staticmethod
+    def _open_cache(path: str) -> sqlite3.Connection:
+        """Open (and create if needed) the cache database"""
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS classifications (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS vimeo_pages (key TEXT PRIMARY KEY, value TEXT, ts INTEGER)"
+        )
+        conn.commit()
+        return conn
+
+    def _cache_key(self, video: Dict) -> str:
+        """Cache key for a video: the model plus everything sent in the prompt"""
+        raw = "\0".join((
+            self.claude_model,
+            CLASSIFICATION_INSTRUCTIONS,
+            video["title"] or "",
+            video["description"][:300],
+            (video.get("created_time") or "")[:4],
+        ))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, keys: List[str]) -> Dict[str, Dict]:
+        """Look up cached classifications, returning only the hits"""
+        if self._cache is None:
+            return {}
+
+        hits = {}
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i+500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._cache_lock:
+                rows = self._cache.execute(
+                    f"SELECT key, value FROM classifications WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            for key, value in rows:
+                hits[key] = json.loads(value)
+        return hits
+
+    def _cache_put(self, entries: Dict[str, Dict]):
+        """Store new classifications in the cache"""
+        if self._cache is None or not entries:
+            return
+
+        with self._cache_lock:
+            self._cache.executemany(
+                "INSERT OR REPLACE INTO classifications (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in entries.items()]
+            )
+            self._cache.commit()
+
+    def _fetch_page(self, query: str, page: int, per_page: int,
+                    max_age: int = 24 * 60 * 60) -> Optional[Dict]:
+        """
+        Fetch one page of Vimeo search results
+
+        Pages are cached on disk for `max_age` seconds, so repeated runs of
+        the same queries do not hit the API again. Returns None if the
+        request is rejected (bad token, no access, not found); any other
+        error is raised once the session's retries are used up.
+        """
+        key = f"{query}:{page}:{per_page}"
         
-    def search_vimeo(self, query: str, max_results: int = 50) -> List[Dict]:
-        """Search Vimeo using API"""
+        if self._cache is not None:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT value FROM vimeo_pages WHERE key = ? AND ts > ?",
+                    (key, int(time.time()) - max_age)
+                ).fetchone()
+            if row:
+                return json.loads(row[0])
+        
+        params = {
+            "query": query,
+            "per_page": per_page,
+            "page": page,
+            # Only return the fields we read in search_vimeo; full video
+            # objects are many times larger
+            "fields": "uri,name,link,description,duration,created_time,stats.plays,user.name"
+        }
+        
+        response = self.session.get(
+            f"{self.vimeo_base_url}/videos",
+            headers=self.vimeo_headers,
+            params=params,
+            timeout=self.vimeo_timeout
+        )
+        
+        # Auth and not-found errors will not go away on retry
+        if response.status_code in (401, 403, 404):
+            print(f"  Vimeo API error: {response.status_code}")
+            return None
+        response.raise_for_status()
+        
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO vimeo_pages (key, value, ts) VALUES (?, ?, ?)",
+                    (key, response.content.decode("utf-8"), int(time.time()))
+                )
+                self._cache.commit()
+        
+        # Parse straight from the raw bytes, skipping requests' text
+        # decoding and charset detection
+        return json.loads(response.content)
+        
+    @staticmethod
+    def _video_from_api(video: Dict, query: str) -> Dict:
+        """Extract the fields we keep from a Vimeo API video object"""
+        return {
+            "title": video.get("name", ""),
+            "url": video.get("link", ""),
+            # Kept in full for the CSV; only the prompt is trimmed
+            "description": video.get("description") or "",
+            "duration": video.get("duration", 0),
+            "created_time": video.get("created_time", ""),
+            "views": video.get("stats", {}).get("plays", 0),
+            "user": video.get("user", {}).get("name", ""),
+            # Tag with the originating query so results can be analysed
+            # per query without re-matching
+            "source_query": query
+        }
+
+    def search_vimeo(self, query: str, max_results: int = 50, max_workers: int = 8) -> List[Dict]:
+        """
+        Search Vimeo using API
+
+        The first page is fetched on its own to learn the total result
+        count; any further pages needed for `max_results` are then fetched
+        concurrently.
+        """
         if not self.vimeo_token:
             print("⚠️  No Vimeo API token provided")
             return []
         
-        headers = {
-            "Authorization": f"Bearer {self.vimeo_token}",
-            "Accept": "application/vnd.vimeo.*+json;version=3.4"
-        }
+        print(f"🔍 Searching Vimeo for: '{query}'...")
         
-        videos = []
-        page = 1
+        # Vimeo allows up to 100 results per page. per_page stays fixed
+        # across pages so page offsets line up.
+        per_page = min(100, max_results)
+        pages = []
         
-        print(f"🔍 Searching Vimeo for: '{query}'...")
+        try:
+            first = self._fetch_page(query, 1, per_page)
+            
+            if first and first.get("data"):
+                pages.append(first)
+                
+                last_page = min(
+                    math.ceil(first.get("total", 0) / per_page),
+                    math.ceil(max_results / per_page)
+                )
+                
+                # paging.next is null on the last page
+                if last_page > 1 and first.get("paging", {}).get("next"):
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        for data in executor.map(
+                            lambda page: self._fetch_page(query, page, per_page),
+                            range(2, last_page + 1)
+                        ):
+                            if not data or not data.get("data"):
+                                break
+                            pages.append(data)
+            
+        except Exception as e:
+            print(f"Error: {e}")
         
-        while len(videos) < max_results:
-            try:
-                params = {
-                    "query": query,
-                    "per_page": min(25, max_results - len(videos)),
-                    "page": page
+        videos = [self._video_from_api(video, query) for data in pages for video in data["data"]]
+        return videos[:max_results]
+
+    def search_vimeo_many(self, queries: List[str], max_results: int = 50,
+                          max_workers: int = 8) -> List[List[Dict]]:
+        """
+        Search several queries concurrently
+
+        Requests are network-bound, so queries run on a thread pool instead
+        of one after another. Results are returned in the same order as
+        `queries`, so deduplication downstream stays deterministic.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda query: self.search_vimeo(query, max_results=max_results),
+                queries
+            ))
+    
+    def _batch_params(self, batch: List[Dict]) -> Dict:
+        """Build the Messages API request body for one batch of videos"""
+        # Prepare video info for AI (only the first 300 description
+        # characters are sent)
+        video_info = [
+            {
+                "title": v["title"],
+                "description": v["description"][:300],
+                "year": (v["created_time"] or "")[:4]
+            }
+            for v in batch
+        ]
+        
+        return {
+            "model": self.claude_model,
+            # Room for a full batch of classification objects
+            "max_tokens": 4000,
+            # The instructions are identical for every batch, so mark them
+            # for Anthropic's prompt cache; only the video list varies.
+            "system": [
+                {
+                    "type": "text",
+                    "text": CLASSIFICATION_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"}
                 }
-                
-                response = requests.get(
-                    f"{self.vimeo_base_url}/videos",
-                    headers=headers,
-                    params=params
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": json.dumps(video_info, separators=(",", ":"), ensure_ascii=False)
+                }
+            ]
+        }
+
+    def _classify_batch(self, batch: List[Dict], attempts: int = 2) -> Optional[List[Dict]]:
+        """
+        Classify a single batch of videos with Claude
+
+        Returns Claude's classifications in batch order, or None if the API
+        call or response parsing fails. A response whose array length does
+        not match the batch is retried, since results are merged by position.
+        """
+        data = self._batch_params(batch)
+        
+        for attempt in range(1, attempts + 1):
+            try:
+                response = self.session.post(
+                    self.claude_base_url,
+                    headers=self.claude_headers,
+                    json=data,
+                    timeout=self.claude_timeout
                 )
                 
                 if response.status_code != 200:
-                    break
-                
-                data = response.json()
-                
-                if not data.get("data"):
-                    break
+                    print(f"  API error: {response.status_code}")
+                    return None
                 
-                for video in data["data"]:
-                    videos.append({
-                        "title": video.get("name", ""),
-                        "url": video.get("link", ""),
-                        "description": video.get("description", ""),
-                        "duration": video.get("duration", 0),
-                        "created_time": video.get("created_time", ""),
-                        "views": video.get("stats", {}).get("plays", 0),
-                        "user": video.get("user", {}).get("name", "")
-                    })
+                result = json.loads(response.content)
+                classifications = json.loads(result["content"][0]["text"])
                 
-                page += 1
+                if len(classifications) == len(batch):
+                    return classifications
                 
+                print(f"  ⚠️  Expected {len(batch)} classifications, got "
+                      f"{len(classifications)} (attempt {attempt}/{attempts})")
+                    
             except Exception as e:
-                print(f"Error: {e}")
-                break
+                print(f"  Error classifying batch: {e}")
+                return None
         
-        return videos[:max_results]
+        return None
     
-    def classify_with_ai(self, videos: List[Dict]) -> List[Dict]:
+    def _classify_with_batch_api(self, batches: List[List[Dict]],
+                                 poll_interval: int = 30) -> List[Optional[List[Dict]]]:
+        """
+        Classify batches of videos through the Message Batches API
+
+        All batches are submitted as a single job, billed at half the price
+        of regular calls, and polled every `poll_interval` seconds until it
+        ends (usually minutes, at most 24 hours). Returns one entry per
+        batch, in order: its classifications, or None if that request
+        failed or returned the wrong number of items.
+        """
+        results = [None] * len(batches)
+        if not batches:
+            return results
+        
+        batches_url = f"{self.claude_base_url}/batches"
+        
+        try:
+            response = self.session.post(
+                batches_url,
+                headers=self.claude_headers,
+                json={
+                    "requests": [
+                        {"custom_id": str(i), "params": self._batch_params(batch)}
+                        for i, batch in enumerate(batches)
+                    ]
+                },
+                timeout=self.claude_timeout
+            )
+            response.raise_for_status()
+            job = json.loads(response.content)
+            print(f"  📨 Submitted batch job {job['id']} ({len(batches)} requests)")
+            
+            while job["processing_status"] != "ended":
+                time.sleep(poll_interval)
+                response = self.session.get(
+                    f"{batches_url}/{job['id']}",
+                    headers=self.claude_headers,
+                    timeout=self.claude_timeout
+                )
+                response.raise_for_status()
+                job = json.loads(response.content)
+                counts = job["request_counts"]
+                print(f"  ⏳ {counts['processing']} processing, "
+                      f"{counts['succeeded']} succeeded, {counts['errored']} errored")
+            
+            # Results come back as JSONL in no particular order; custom_id
+            # is the batch's position in `batches`
+            response = self.session.get(
+                job["results_url"],
+                headers=self.claude_headers,
+                timeout=self.claude_timeout,
+                stream=True
+            )
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                entry = json.loads(line)
+                i = int(entry["custom_id"])
+                if entry["result"]["type"] != "succeeded":
+                    print(f"  API error in batch {i}: {entry['result']['type']}")
+                    continue
+                try:
+                    message = entry["result"]["message"]
+                    classifications = json.loads(message["content"][0]["text"])
+                except (KeyError, IndexError, ValueError) as e:
+                    print(f"  Error parsing batch {i}: {e}")
+                    continue
+                if len(classifications) != len(batches[i]):
+                    print(f"  ⚠️  Expected {len(batches[i])} classifications, got "
+                          f"{len(classifications)} in batch {i}")
+                    continue
+                results[i] = classifications
+                
+        except Exception as e:
+            print(f"  Error running batch job: {e}")
+        
+        return results
+    
+    @staticmethod
+    def dedupe_reuploads(videos: List[Dict]) -> List[Dict]:
+        """
+        Drop re-uploads of the same film under different URLs
+
+        Videos with the same title (ignoring case and surrounding whitespace)
+        and the same duration are treated as copies; the first one is kept.
+        Untitled videos are never merged.
+        """
+        seen = set()
+        unique = []
+        for video in videos:
+            title = (video["title"] or "").strip().casefold()
+            if title:
+                key = (title, video["duration"])
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique.append(video)
+        return unique
+
+    def classify_with_ai(self, videos: List[Dict], max_workers: int = 8,
+                         use_batch_api: bool = False) -> List[Dict]:
         """
         Use Claude AI to classify and enhance video information
         
@@ -94,6 +551,15 @@ class AIEnhancedMovieFinder:
         - Classify genre (horror, comedy, drama, etc.)
         - Estimate if it's actually an old/classic film
         - Add quality/relevance score
+        
+        Classifications from previous runs are served from the local cache;
+        only cache misses are sent to Claude. Batches are sent concurrently,
+        at most `max_workers` at a time, and merged back in their original
+        order. Videos whose batch fails are returned unenhanced.
+        
+        With `use_batch_api`, all batches are instead submitted as one
+        Message Batches job: half the cost, but results arrive only when
+        the whole job has finished.
         """
         if not self.claude_api_key:
             print("⚠️  No Claude API key provided. Skipping AI classification.")
@@ -101,96 +567,82 @@ class AIEnhancedMovieFinder:
         
         print("\n🤖 Using AI to classify videos...")
         
-        # Process videos in batches
-        batch_size = 10
-        enhanced_videos = []
+        keys = [self._cache_key(v) for v in videos]
+        classifications = self._cache_get(keys)
+        misses = [i for i, key in enumerate(keys) if key not in classifications]
         
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i+batch_size]
-            
-            # Prepare video info for AI
-            video_info = []
-            for v in batch:
-                video_info.append({
-                    "title": v["title"],
-                    "description": v["description"][:300] if v["description"] else "",
-                    "year": v.get("created_time", "")[:4]
-                })
-            
-            # Create prompt for Claude
-            prompt = f"""Analyze these videos and determine which are genuinely old/classic films (pre-1970) or compilations/restorations of old film content.
-For each video, provide:
-- is_old_movie: true/false (is this actually a classic/old film or restoration/compilation of old film footage?)
-- estimated_era: decade like "1920s", "1940s", or "modern" (based on the FILM CONTENT, not upload date)
-- genre: primary genre (horror, comedy, drama, western, sci-fi, etc.)
-- relevance_score: 1-10 (how relevant is this to someone searching for old movies? Give higher scores to actual old film content, restorations, and compilations)
-
-Videos:
-{json.dumps(video_info, indent=2)}
-
-Respond with ONLY a JSON array of objects, one per video, in the same order.
-Example format:
-[
-  {{"is_old_movie": true, "estimated_era": "1920s", "genre": "comedy", "relevance_score": 9}},
-  {{"is_old_movie": false, "estimated_era": "modern", "genre": "documentary", "relevance_score": 3}}
-]"""
-
-            try:
-                headers = {
-                    "x-api-key": self.claude_api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                }
-                
-                data = {
-                    "model": "claude-sonnet-4-20250514",
-                    "max_tokens": 2000,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ]
-                }
-                
-                response = requests.post(
-                    self.claude_base_url,
-                    headers=headers,
-                    json=data
+        if classifications:
+            print(f"  ♻️  {len(videos) - len(misses)} videos classified from cache")
+        
+        # Process cache misses in batches (of indices into `videos`)
+        batch_size = 40
+        batches = [misses[i:i+batch_size] for i in range(0, len(misses), batch_size)]
+        new_entries = {}
+        processed = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if use_batch_api:
+                results = self._classify_with_batch_api(
+                    [[videos[i] for i in indices] for indices in batches]
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    classifications = json.loads(result["content"][0]["text"])
-                    
-                    # Merge classifications with original videos
-                    for video, classification in zip(batch, classifications):
-                        enhanced_video = {**video, **classification}
-                        enhanced_videos.append(enhanced_video)
-                    
-                    print(f"  Processed {len(enhanced_videos)}/{len(videos)} videos...")
-                else:
-                    print(f"  API error: {response.status_code}")
-                    # Return unenhanced videos
-                    enhanced_videos.extend(batch)
-                    
-            except Exception as e:
-                print(f"  Error classifying batch: {e}")
-                enhanced_videos.extend(batch)
+            else:
+                results = executor.map(
+                    lambda indices: self._classify_batch([videos[i] for i in indices]),
+                    batches
+                )
+            for indices, result in zip(batches, results):
+                processed += len(indices)
+                if result:
+                    for i, classification in zip(indices, result):
+                        new_entries[keys[i]] = classification
+                print(f"  Processed {processed}/{len(misses)} videos...")
         
-        return enhanced_videos
+        self._cache_put(new_entries)
+        classifications.update(new_entries)
+        
+        # Merge classifications with original videos
+        return [
+            {**video, **classifications[key]} if key in classifications else video
+            for video, key in zip(videos, keys)
+        ]
     
     def filter_by_relevance(self, videos: List[Dict], min_score: int = 6) -> List[Dict]:
-        """Filter videos by relevance score"""
-        if not videos or 'relevance_score' not in videos[0]:
+        """
+        Filter videos by relevance score
+
+        Videos without a score (their AI batch failed) are dropped, unless
+        no video was scored at all, in which case nothing is filtered.
+        """
+        filtered = []
+        scored = False
+        for v in videos:
+            score = v.get('relevance_score')
+            if score is not None:
+                scored = True
+                if score >= min_score:
+                    filtered.append(v)
+        
+        if not scored:
             return videos
         
-        filtered = [v for v in videos if v.get('relevance_score', 0) >= min_score]
         print(f"\n✂️  Filtered: {len(videos)} → {len(filtered)} videos (min score: {min_score})")
         return filtered
     
-    def save_to_csv(self, videos: List[Dict], filename: str = "vimeo_movies_ai_enhanced.csv"):
-        """Save to CSV"""
+    def save_to_csv(self, videos: Iterable[Dict], filename: str = "vimeo_movies_ai_enhanced.csv",
+                    fieldnames: Sequence[str] = VIDEO_FIELDS + AI_FIELDS):
+        """
+        Save to CSV
+
+        Rows are streamed to disk as `videos` is iterated, so a generator can
+        be passed without materializing every row first. The header comes
+        from the static `fieldnames` schema: missing fields are left empty
+        (e.g. videos whose AI batch failed) and extra keys are ignored.
+        """
         import os
 
-        if not videos:
+        videos = iter(videos)
+        first = next(videos, None)
+        if first is None:
             return
 
         # Create outputs directory if it doesn't exist
@@ -200,10 +652,15 @@ Example format:
 
         output_path = os.path.join(output_dir, filename)
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=videos[0].keys())
-            writer.writeheader()
-            writer.writerows(videos)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            # Plain csv.writer over pre-ordered tuples avoids DictWriter's
+            # per-row key validation
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerow([first.get(field, "") for field in fieldnames])
+            writer.writerows(
+                [video.get(field, "") for field in fieldnames] for video in videos
+            )
 
         print(f"\n✅ Saved to {output_path}")
         return output_path
@@ -240,49 +697,34 @@ def main():
         claude_api_key=CLAUDE_API_KEY
     )
     
-    # Search Vimeo with broader queries
-    queries = [
-        # Era-based
-        "1920s movies",
-        "1930s movies",
-        "1940s movies",
-        "1950s movies",
-        "1960s movies",
-        # Style-based
-        "classic films",
-        "silent movies",
-        "silent films",
-        "vintage cinema",
-        "old movies",
-        "black and white films",
-        # Genre-based
-        "old horror movies",
-        "film noir",
-        "classic western",
-        "vintage comedy",
-        "old sci-fi films",
-        # General
-        "public domain films",
-        "classic hollywood",
-        "golden age cinema"
-    ]
 
     all_videos = []
     seen_urls = set()
 
-    for query in queries:
-        videos = finder.search_vimeo(query, max_results=50)
-        
+    for videos in finder.search_vimeo_many(SEARCH_QUERIES, max_results=50):
+        # Dedupe within the query (dict keys keep first-occurrence order, and
+        # setdefault keeps the first record), then drop URLs already returned
+        # by earlier queries in one set op
+        by_url = {}
         for video in videos:
-            if video["url"] not in seen_urls:
-                all_videos.append(video)
-                seen_urls.add(video["url"])
+            by_url.setdefault(video["url"], video)
+        new_urls = by_url.keys() - seen_urls
+        all_videos.extend(video for url, video in by_url.items() if url in new_urls)
+        seen_urls |= new_urls
     
     print(f"\n✅ Found {len(all_videos)} unique videos from Vimeo")
 
+    # Re-uploads have distinct URLs; drop them before paying to classify
+    deduped = finder.dedupe_reuploads(all_videos)
+    if len(deduped) < len(all_videos):
+        print(f"  Removed {len(all_videos) - len(deduped)} re-uploads")
+    all_videos = deduped
+
     # Classify with AI
     if CLAUDE_API_KEY:
-        enhanced_videos = finder.classify_with_ai(all_videos)
+        # Message Batches are half price but take minutes to come back
+        use_batch_api = os.getenv("CLAUDE_USE_BATCH_API", "").lower() in ("1", "true", "yes")
+        enhanced_videos = finder.classify_with_ai(all_videos, use_batch_api=use_batch_api)
         
         # Filter for high relevance (lowered threshold to be more inclusive)
         filtered_videos = finder.filter_by_relevance(enhanced_videos, min_score=5)
@@ -292,7 +734,8 @@ def main():
     
     # Save results
     if filtered_videos:
-        finder.save_to_csv(filtered_videos)
+        fieldnames = VIDEO_FIELDS + AI_FIELDS if CLAUDE_API_KEY else VIDEO_FIELDS
+        finder.save_to_csv(filtered_videos, fieldnames=fieldnames)
         
         # Print sample
         print("\n📋 Sample results:")
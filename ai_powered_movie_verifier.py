@@ -11,173 +11,875 @@ Three-stage pipeline:
 """
 
 import os
+import re
 import json
 import time
+import threading
 import requests
-from typing import List, Dict, Optional
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from llm_cache import LLMCache
+from rate_limit import TokenBucket
+
+
+# Reused encoders: json.dumps builds a new JSONEncoder on every call with
+# non-default options. Both use the C encoder (no indent).
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_CANONICAL_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+# Fields each stage merges into a video; anything else Claude returns is
+# dropped, so records only carry the documented schema
+STAGE1_FIELDS = ("content_type", "content_confidence", "content_reasoning")
+STAGE2_FIELDS = ("is_feature_film", "has_narrative", "narrative_confidence", "film_reasoning")
+STAGE3_FIELDS = (
+    "estimated_production_year", "estimated_era", "is_pre_1965", "production_company",
+    "is_formal_studio", "genre", "quality_score", "era_reasoning"
+)
+STAGE_ALL_FIELDS = STAGE1_FIELDS + STAGE2_FIELDS + STAGE3_FIELDS
+
+# Token counts reported in each reply's "usage"; the cache fields show how
+# much of the system prompt was served from Anthropic's prompt cache
+USAGE_FIELDS = (
+    "input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens"
+)
+
+# JSON schema of each field, used to force structured output via tool use
+_FIELD_SCHEMAS = {
+    "content_type": {
+        "type": "string",
+        "enum": ["MOVIE", "TRAILER", "REVIEW", "PROMO", "TEST", "ESSAY", "OTHER"]
+    },
+    "content_confidence": {"type": "number"},
+    "content_reasoning": {"type": "string"},
+    "is_feature_film": {"type": "boolean"},
+    "has_narrative": {"type": "boolean"},
+    "narrative_confidence": {"type": "number"},
+    "film_reasoning": {"type": "string"},
+    "estimated_production_year": {"type": ["integer", "null"]},
+    "estimated_era": {"type": "string"},
+    "is_pre_1965": {"type": "boolean"},
+    "production_company": {"type": ["string", "null"]},
+    "is_formal_studio": {"type": "boolean"},
+    "genre": {"type": "string"},
+    "quality_score": {"type": "integer"},
+    "era_reasoning": {"type": "string"},
+}
+
+
+def _classification_tool(fields: Tuple[str, ...], nullable: Tuple[str, ...] = ()) -> Dict:
+    """
+    Build the tool Claude must call to return a stage's results.
+
+    Args:
+        fields: Fields of each per-video result, all required
+        nullable: Fields that may also be null
+    """
+    # Results are matched back to videos by id, not by position, so a
+    # skipped or reordered result can't shift the rest onto the wrong video
+    properties = {"id": {"type": "integer"}}
+    for field in fields:
+        schema = _FIELD_SCHEMAS[field]
+        properties[field] = {"anyOf": [schema, {"type": "null"}]} if field in nullable else schema
+
+    return {
+        "name": "record_classifications",
+        "description": "Record the classification of every video, identified by its id.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": properties,
+                        "required": ["id", *fields]
+                    }
+                }
+            },
+            "required": ["results"]
+        }
+    }
+
+
+STAGE1_TOOL = _classification_tool(STAGE1_FIELDS)
+STAGE2_TOOL = _classification_tool(STAGE2_FIELDS)
+STAGE3_TOOL = _classification_tool(STAGE3_FIELDS)
+# Later fields are null once a video fails an earlier check
+STAGE_ALL_TOOL = _classification_tool(STAGE_ALL_FIELDS, nullable=STAGE2_FIELDS + STAGE3_FIELDS)
+
+# Per-batch user message; the rubric itself is the (cached) system prompt
+VIDEOS_TEMPLATE = "Videos:\n%s"
+
+# Stage rubrics: static instructions sent as a cached system prompt with
+# every batch, so only the video list changes between calls.
+STAGE1_RUBRIC = """Analyze these videos and classify their content type.
+
+Videos are given as a JSON array of objects with these keys:
+id = video id (copy it into the video's result),
+t = title, d = description, m = duration in minutes, tg = tags,
+u = uploader, v = view count
+
+For each video, determine:
+1. content_type: Choose ONE from: MOVIE, TRAILER, REVIEW, PROMO, TEST, ESSAY, OTHER
+   - MOVIE: Full-length feature film (narrative story, 45+ minutes)
+   - TRAILER: Preview/teaser for a movie (typically 1-5 minutes)
+   - REVIEW: Analysis, critique, or discussion about movies
+   - PROMO: Promotional content (channel IDs, network promos, ads)
+   - TEST: Technical tests (camera, lens, VFX breakdowns)
+   - ESSAY: Video essays about film/cinema
+   - OTHER: Doesn't fit above categories
+
+2. content_confidence: Float 0.0-1.0 (how certain are you?)
+
+3. content_reasoning: 1-2 sentence explanation of your classification
+
+Red flags for NON-MOVIES:
+- Titles with: "trailer", "promo", "review", "breakdown", "test", "essay", "recap"
+- Very short duration (< 20 minutes) suggests trailer/promo
+- Descriptions mentioning: "client:", "agency:", "director:", "shot on", "VFX"
+- Channel names for networks/studios suggest promos
+
+Green flags for MOVIES:
+- Duration 45-180 minutes
+- Plot/story elements in description
+- Character names mentioned
+- Classic movie vocabulary: "starring", "directed by", "film noir", "drama"
+
+Record one result per video, tagged with its id, with the
+record_classifications tool."""
+
+STAGE2_RUBRIC = """These videos were classified as "MOVIE" in initial screening.
+Now verify if they are genuine FEATURE-LENGTH NARRATIVE FILMS.
+
+Videos are given as a JSON array of objects with these keys:
+id = video id (copy it into the video's result),
+t = title, d = description, m = duration in minutes,
+cr = reasoning from the initial screening, tg = tags, u = uploader
+
+For each video, determine:
+1. is_feature_film: true/false
+   - TRUE if: Narrative story, character-driven, 40+ minutes, theatrical release quality
+   - FALSE if: Documentary about films, compilation, short film (<40 min), music video
+
+2. has_narrative: true/false
+   - Does it tell a story with characters and plot?
+   - Or is it experimental/abstract/documentary?
+
+3. narrative_confidence: Float 0.0-1.0
+
+4. film_reasoning: 2-3 sentence explanation with specific evidence
+
+Look for POSITIVE indicators:
+- Plot summary or story synopsis in description
+- Character names (not just actor names)
+- Genre keywords: drama, comedy, thriller, western, noir, horror, sci-fi
+- Duration 40-180 minutes
+- "Starring", "directed by", "screenplay", "based on"
+- Film festival mentions, theatrical release info
+
+Look for NEGATIVE indicators:
+- "Documentary about...", "The story of how...", "Behind the scenes"
+- "Supercut", "compilation", "collection", "montage", "tribute"
+- Very short (<40 min) or very long (>200 min) duration
+- "Music video", "concert film", "performance"
+- Educational/instructional content
+- Modern YouTube/Vimeo creator style descriptions
+
+Record one result per video, tagged with its id, with the
+record_classifications tool."""
+
+STAGE3_RUBRIC = """These are verified feature-length narrative films.
+Determine their production era and studio authenticity.
+
+Videos are given as a JSON array of objects with these keys:
+id = video id (copy it into the video's result),
+t = title, d = description, m = duration in minutes,
+up = upload date, u = uploader, fr = reasoning from the feature film check
+
+For each video, determine:
+
+1. estimated_production_year: Best guess of PRODUCTION year (not upload date!)
+   - Analyze title, description for year clues
+   - Look for decade indicators: "1940s classic", "pre-code", "silent era"
+   - Actor/director names can indicate era
+   - Return null if truly uncertain
+
+2. estimated_era: Decade string
+   - "1900s", "1910s", "1920s", "1930s", "1940s", "1950s", "1960s"
+   - "1970s", "1980s", "modern" (1990+)
+
+3. is_pre_1965: true/false
+   - Conservative estimate - only true if confident it's pre-1965
+
+4. production_company: Studio/production company name or null
+   - Extract from description or title
+   - Classic studios: MGM, Paramount, Warner Bros, Universal, RKO, 20th Century Fox, Columbia, United Artists
+   - Independent studios also valid
+
+5. is_formal_studio: true/false
+   - TRUE if produced by recognized studio (major or established independent)
+   - FALSE if amateur, modern indie, or uncertain
+
+6. genre: Primary genre
+   - drama, comedy, thriller, horror, western, noir, sci-fi, romance, war, crime, musical
+
+7. quality_score: Integer 1-10
+   - How confident are you this is a genuine classic movie worth watching?
+   - Consider: era authenticity, studio legitimacy, genre clarity
+   - 8-10: Highly confident classic
+   - 5-7: Probable classic, some uncertainty
+   - 1-4: Uncertain or likely not a true classic
+
+8. era_reasoning: 2-3 sentences explaining your era/studio determination
+
+Evidence to look for:
+- Year in title: "Nosferatu (1922)", "The 39 Steps 1935"
+- Era descriptors: "silent film", "pre-code", "golden age", "classic hollywood"
+- Known classic titles: Casablanca, Citizen Kane, Metropolis, etc.
+- Actor names: Chaplin, Bogart, Hepburn, Grant indicate classic era
+- Director names: Hitchcock, Hawks, Ford, Lang, Welles
+- Studio mentions in description
+- "Public domain", "copyright expired" suggests pre-1965
+
+Be CONSERVATIVE with is_pre_1965 - only mark true if you have good evidence.
+
+Record one result per video, tagged with its id, with the
+record_classifications tool."""
+
+
+STAGE_ALL_RUBRIC = """Classify these videos in a single pass: content type, feature film
+analysis, and production era / studio verification.
+
+Videos are given as a JSON array of objects with these keys:
+id = video id (copy it into the video's result),
+t = title, d = description, m = duration in minutes, tg = tags,
+u = uploader, v = view count, up = upload date
+
+For each video, determine:
+
+1. content_type: Choose ONE from: MOVIE, TRAILER, REVIEW, PROMO, TEST, ESSAY, OTHER
+   - MOVIE: Full-length feature film (narrative story, 45+ minutes)
+   - TRAILER: Preview/teaser for a movie (typically 1-5 minutes)
+   - REVIEW: Analysis, critique, or discussion about movies
+   - PROMO: Promotional content (channel IDs, network promos, ads)
+   - TEST: Technical tests (camera, lens, VFX breakdowns)
+   - ESSAY: Video essays about film/cinema
+   - OTHER: Doesn't fit above categories
+2. content_confidence: Float 0.0-1.0
+3. content_reasoning: 1 sentence explanation
+
+If content_type is not MOVIE, set every remaining field to null.
+
+4. is_feature_film: true/false
+   - TRUE if: Narrative story, character-driven, 40+ minutes, theatrical release quality
+   - FALSE if: Documentary about films, compilation, short film (<40 min), music video
+5. has_narrative: true/false - does it tell a story with characters and plot?
+6. narrative_confidence: Float 0.0-1.0
+7. film_reasoning: 1-2 sentences with specific evidence
+
+If is_feature_film is false, set every remaining field to null.
+
+8. estimated_production_year: Best guess of PRODUCTION year (not upload date!), or null
+9. estimated_era: "1900s" ... "1980s", or "modern" (1990+)
+10. is_pre_1965: true/false - conservative, only true with good evidence
+11. production_company: Studio/production company name or null
+12. is_formal_studio: true if produced by a recognized studio (major or established independent)
+13. genre: drama, comedy, thriller, horror, western, noir, sci-fi, romance, war, crime, musical
+14. quality_score: Integer 1-10 - how confident are you this is a genuine classic movie?
+    (8-10 highly confident, 5-7 probable, 1-4 uncertain)
+15. era_reasoning: 1-2 sentences explaining your era/studio determination
+
+Red flags for NON-MOVIES:
+- Titles with: "trailer", "promo", "review", "breakdown", "test", "essay", "recap"
+- Very short duration (< 20 minutes) suggests trailer/promo
+- Descriptions mentioning: "client:", "agency:", "shot on", "VFX"
+- "Documentary about...", "Behind the scenes", "Supercut", "compilation", "tribute"
+
+Evidence of a classic feature film:
+- Plot summary, character names, "starring", "directed by", "based on"
+- Duration 40-180 minutes
+- Year in title: "Nosferatu (1922)", "The 39 Steps 1935"
+- Era descriptors: "silent film", "pre-code", "golden age", "classic hollywood"
+- Classic actors/directors: Chaplin, Bogart, Hepburn, Hitchcock, Ford, Lang, Welles
+- "Public domain", "copyright expired" suggests pre-1965
+
+Record one result per video, tagged with its id, with the
+record_classifications tool."""
+
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+
+
+def _parse_json_array(text: str) -> List:
+    """
+    Parse the JSON array in a Claude reply.
+
+    Tolerates chatter or code fences around the array and trailing commas,
+    so a reply that is almost valid still yields its classifications.
+
+    Raises:
+        ValueError: If no JSON array can be parsed
+    """
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in response")
+
+    body = text[start:end + 1]
+    try:
+        result = json.loads(body)
+    except json.JSONDecodeError:
+        result = json.loads(_TRAILING_COMMA_RE.sub(r"\1", body))
+
+    if not isinstance(result, list):
+        raise ValueError("response is not a JSON array")
+    return result
+
+
+# Title keywords that mark a short video as something other than a movie
+TRAILER_RE = re.compile(
+    r"\b(trailer|teaser|promo|breakdown|recap|review|behind the scenes)\b",
+    re.IGNORECASE
+)
+_KEYWORD_TYPES = {
+    "trailer": "TRAILER",
+    "teaser": "TRAILER",
+    "promo": "PROMO",
+    "breakdown": "TEST",
+    "recap": "REVIEW",
+    "review": "REVIEW",
+    "behind the scenes": "OTHER",
+}
+
+
+def _cheap_classify(video: Dict) -> Optional[Dict]:
+    """
+    Classify an obvious non-movie without calling Claude.
+
+    Applies the rubric's own red flags: a trailer/promo/review keyword in
+    the title of a video under 20 minutes, or any video under 5 minutes.
+    Videos with unknown duration are always left to Claude.
+
+    Returns:
+        Stage 1 fields for a clear-cut case, or None if Claude is needed
+    """
+    duration = video.get("duration") or 0
+    if not duration or duration >= 20 * 60:
+        return None
+
+    match = TRAILER_RE.search(video.get("title") or "")
+    if match:
+        return {
+            "content_type": _KEYWORD_TYPES[match.group(1).lower()],
+            "content_confidence": 1.0,
+            "content_reasoning": f"Under 20 minutes with '{match.group(1)}' in the title"
+        }
+    if duration < 5 * 60:
+        return {
+            "content_type": "PROMO",
+            "content_confidence": 1.0,
+            "content_reasoning": "Under 5 minutes, too short for a feature film"
+        }
+    return None
+
+
+# Filters applied after each stage (and all at once by stage_all)
+def _is_movie(video: Dict) -> bool:
+    """Stage 1 filter: MOVIE content type with confidence > 0.7."""
+    return video.get("content_type") == "MOVIE" and (video.get("content_confidence") or 0) > 0.7
+
+
+def _is_feature_film(video: Dict) -> bool:
+    """Stage 2 filter: genuine feature film with narrative confidence > 0.6."""
+    return video.get("is_feature_film") == True and (video.get("narrative_confidence") or 0) > 0.6
+
+
+def _is_classic(video: Dict) -> bool:
+    """Stage 3 filter: pre-1965 with quality score >= 6."""
+    return video.get("is_pre_1965") == True and (video.get("quality_score") or 0) >= 6
+
 
 class AIMovieVerifier:
     """Multi-stage AI classifier for authentic movie verification."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 8,
+        cache_path: Optional[str] = os.path.join("outputs", ".claude_cache.sqlite"),
+        use_batch_api: bool = False,
+        requests_per_minute: int = 50,
+        cache_ttl_days: Optional[float] = None
+    ):
         """
         Initialize AI movie verifier.
 
         Args:
             api_key: Anthropic Claude API key
+            max_concurrency: Maximum number of Claude calls in flight at once
+            cache_path: SQLite file used to cache Claude responses across
+                runs (None disables the cache)
+            use_batch_api: Send each stage's batches as one Message Batches
+                job (half price, but results take minutes to arrive)
+            requests_per_minute: Initial request rate limit; replaced by the
+                limit Anthropic reports in its response headers
+            cache_ttl_days: Ignore cached responses older than this many
+                days (None keeps them forever)
         """
         self.api_key = api_key
         self.base_url = "https://api.anthropic.com/v1/messages"
         self.model = "claude-sonnet-4-20250514"
+        self.max_concurrency = max_concurrency
+        self.cache = LLMCache(cache_path, cache_ttl_days) if cache_path else None
+        self.use_batch_api = use_batch_api
+        self.rate_limiter = TokenBucket(requests_per_minute)
+        # Token usage summed over every API reply, including prompt cache
+        # reads and writes, so the cache's effect is visible per run
+        self.usage = Counter()
+        self._usage_lock = threading.Lock()
+
+        # One pooled session for every call, so worker threads reuse
+        # keep-alive connections instead of a new TLS handshake per batch.
+        # Rate limits and overloads are retried with exponential backoff.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504, 529],
+            allowed_methods=frozenset({"GET", "POST"})
+        )
+        self.session = requests.Session()
+        self.session.headers.update({
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        })
+        # Every call goes to one host, so a single pool sized to the worker
+        # count keeps exactly one reusable connection per in-flight call
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max_concurrency,
+                pool_block=True,
+                max_retries=retry
+            )
+        )
+
+    def _request_params(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        tool: Optional[Dict] = None
+    ) -> Dict:
+        """Build the Messages API request body, forcing a call to `tool` if given."""
+        data = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            "messages": [{"role": "user", "content": user_prompt}]
+        }
+        if tool:
+            data["tools"] = [tool]
+            data["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        return data
+
+    def _cache_key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        tool: Optional[Dict]
+    ) -> str:
+        """Cache key covering everything that determines the response."""
+        return LLMCache.make_key(
+            self.model,
+            str(max_tokens),
+            system_prompt,
+            _CANONICAL_JSON.encode(tool),
+            user_prompt
+        )
+
+    @staticmethod
+    def _response_text(message: Dict) -> Optional[str]:
+        """
+        Extract the reply from a Messages API response.
 
-    def _call_claude(self, prompt: str, max_tokens: int = 4000) -> Optional[str]:
+        A forced tool call's results are returned as a JSON array string, so
+        callers and the cache handle both reply kinds the same way. A reply
+        cut off at max_tokens, one with no content, or a tool call without
+        results gives None: a partial answer must not pass as "no
+        classifications".
+        """
+        if message.get("stop_reason") == "max_tokens" or not message.get("content"):
+            return None
+        for block in message["content"]:
+            if block["type"] == "tool_use":
+                results = block["input"].get("results")
+                return _COMPACT_JSON.encode(results) if results is not None else None
+        return message["content"][0]["text"]
+
+    def _record_usage(self, message: Dict):
+        """Add a Messages API reply's token counts to `self.usage`."""
+        usage = message.get("usage") or {}
+        with self._usage_lock:
+            for field in USAGE_FIELDS:
+                self.usage[field] += usage.get(field) or 0
+
+    def _cache_response(self, cache_key: str, text: str):
+        """Store a response, unless it is not JSON the stages can parse."""
+        # A malformed reply is skipped so it is requested again next run.
+        # Every prompt lists at least one video, so an empty array means
+        # nothing usable came back and is skipped too.
+        try:
+            if not _parse_json_array(text):
+                return
+        except ValueError:
+            return
+        self.cache.set(cache_key, text)
+
+    def _call_claude(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4000,
+        tool: Optional[Dict] = None
+    ) -> Optional[str]:
         """
         Make a call to Claude API.
 
+        The system prompt is marked for Anthropic's prompt cache, so the
+        static rubric shared by every batch of a stage is only processed in
+        full once. Identical requests are answered from the on-disk cache,
+        so reruns over the same videos cost nothing.
+
         Args:
-            prompt: The prompt to send
+            system_prompt: Static instructions (the stage rubric)
+            user_prompt: The per-batch prompt
             max_tokens: Maximum tokens for response
+            tool: Tool Claude must answer with (structured output)
 
         Returns:
             Response text or None if error
         """
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json"
-        }
+        if self.cache:
+            cache_key = self._cache_key(system_prompt, user_prompt, max_tokens, tool)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        data = {
-            "model": self.model,
-            "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": prompt}]
-        }
+        data = self._request_params(system_prompt, user_prompt, max_tokens, tool)
 
         try:
-            response = requests.post(
+            self.rate_limiter.acquire()
+            response = self.session.post(
                 self.base_url,
-                headers=headers,
                 json=data,
                 timeout=60
             )
+            # Anthropic reports its per-minute request quota on every reply
+            self.rate_limiter.update(
+                response.headers.get("anthropic-ratelimit-requests-limit"),
+                response.headers.get("anthropic-ratelimit-requests-remaining")
+            )
             response.raise_for_status()
 
-            result = response.json()
-            return result["content"][0]["text"]
+            # Parse straight from the raw bytes, skipping text decoding
+            message = json.loads(response.content)
+            self._record_usage(message)
+            text = self._response_text(message)
+
+            if self.cache and text is not None:
+                self._cache_response(cache_key, text)
+            return text
 
-        except requests.exceptions.RequestException as e:
+        # A malformed body or a reply missing expected keys is treated like
+        # a failed request, so one bad batch doesn't abort the stage
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
             print(f"❌ Claude API error: {e}")
             return None
 
-    def stage1_content_type_detection(
+    def _call_claude_many(
         self,
-        videos: List[Dict],
-        batch_size: int = 10
-    ) -> List[Dict]:
+        system_prompt: str,
+        prompts: List[str],
+        max_tokens: int = 4000,
+        tool: Optional[Dict] = None
+    ) -> Iterator[Tuple[int, Optional[str]]]:
         """
-        Stage 1: Detect content type (movie, trailer, review, promo, etc.).
+        Send several prompts to Claude concurrently.
+
+        Calls are network-bound, so up to `max_concurrency` run at once on a
+        thread pool instead of one after another. With `use_batch_api`, they
+        are sent as a single Message Batches job instead.
 
         Args:
-            videos: List of video dicts with title, description, duration, tags
-            batch_size: Number of videos to process per API call
+            system_prompt: Static instructions shared by every call
+            prompts: Per-batch prompts to send
+            max_tokens: Maximum tokens for each response
+            tool: Tool Claude must answer with (structured output)
+
+        Yields:
+            (index into `prompts`, response text or None on error) as each
+            call completes, so one slow batch does not hold up the rest
+        """
+        if self.use_batch_api:
+            yield from enumerate(self._call_claude_batch(system_prompt, prompts, max_tokens, tool))
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(self._call_claude, system_prompt, prompt, max_tokens, tool): i
+                for i, prompt in enumerate(prompts)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _call_claude_batch(
+        self,
+        system_prompt: str,
+        prompts: List[str],
+        max_tokens: int = 4000,
+        tool: Optional[Dict] = None,
+        poll_interval: int = 30
+    ) -> List[Optional[str]]:
+        """
+        Send prompts through the Message Batches API.
+
+        Cached prompts are answered locally; the rest are submitted as one
+        job, billed at half the price of regular calls, which is polled
+        every `poll_interval` seconds until it ends.
+
+        Args:
+            system_prompt: Static instructions shared by every request
+            prompts: Per-batch prompts to send
+            max_tokens: Maximum tokens for each response
+            tool: Tool Claude must answer with (structured output)
+            poll_interval: Seconds between status checks
 
         Returns:
-            Videos with added fields:
-            - content_type: MOVIE, TRAILER, REVIEW, PROMO, TEST, ESSAY, OTHER
-            - content_confidence: 0.0-1.0 confidence score
-            - content_reasoning: Brief explanation
+            Response text (or None on error) for each prompt, in input order
         """
-        print(f"\n🎬 Stage 1: Content Type Detection ({len(videos)} videos)")
-        print("=" * 70)
+        responses = [None] * len(prompts)
+        cache_keys = {}
 
-        enhanced_videos = []
-
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i + batch_size]
-
-            # Prepare video info with rich metadata
-            video_info = []
-            for v in batch:
-                info = {
-                    "title": v.get("title", ""),
-                    "description": v.get("description", "")[:500],  # More context
-                    "duration_minutes": round(v.get("duration", 0) / 60, 1),
-                    "tags": v.get("tags", []),
-                    "user": v.get("user", ""),
-                    "views": v.get("views", 0)
-                }
-                video_info.append(info)
+        for i, prompt in enumerate(prompts):
+            if self.cache:
+                cache_keys[i] = self._cache_key(system_prompt, prompt, max_tokens, tool)
+                responses[i] = self.cache.get(cache_keys[i])
 
-            prompt = f"""Analyze these videos and classify their content type.
+        pending = [i for i, response in enumerate(responses) if response is None]
+        if not pending:
+            return responses
 
-For each video, determine:
-1. content_type: Choose ONE from: MOVIE, TRAILER, REVIEW, PROMO, TEST, ESSAY, OTHER
-   - MOVIE: Full-length feature film (narrative story, 45+ minutes)
-   - TRAILER: Preview/teaser for a movie (typically 1-5 minutes)
-   - REVIEW: Analysis, critique, or discussion about movies
-   - PROMO: Promotional content (channel IDs, network promos, ads)
-   - TEST: Technical tests (camera, lens, VFX breakdowns)
-   - ESSAY: Video essays about film/cinema
-   - OTHER: Doesn't fit above categories
-
-2. content_confidence: Float 0.0-1.0 (how certain are you?)
+        batches_url = f"{self.base_url}/batches"
 
-3. content_reasoning: 1-2 sentence explanation of your classification
+        try:
+            response = self.session.post(
+                batches_url,
+                json={
+                    "requests": [
+                        {
+                            "custom_id": str(i),
+                            "params": self._request_params(system_prompt, prompts[i], max_tokens, tool)
+                        }
+                        for i in pending
+                    ]
+                },
+                timeout=60
+            )
+            response.raise_for_status()
+            job = response.json()
+            print(f"  📨 Submitted batch job {job['id']} ({len(pending)} requests)")
+
+            while job["processing_status"] != "ended":
+                time.sleep(poll_interval)
+                response = self.session.get(
+                    f"{batches_url}/{job['id']}",
+                    timeout=60
+                )
+                response.raise_for_status()
+                job = response.json()
+
+            # Results arrive as JSONL in any order; custom_id is the
+            # prompt's index
+            response = self.session.get(
+                job["results_url"],
+                timeout=60,
+                stream=True
+            )
+            response.raise_for_status()
 
-Red flags for NON-MOVIES:
-- Titles with: "trailer", "promo", "review", "breakdown", "test", "essay", "recap"
-- Very short duration (< 20 minutes) suggests trailer/promo
-- Descriptions mentioning: "client:", "agency:", "director:", "shot on", "VFX"
-- Channel names for networks/studios suggest promos
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                # The job is already paid for, so a malformed entry only
+                # loses its own result, not every one after it
+                try:
+                    entry = json.loads(line)
+                    i = int(entry["custom_id"])
+                    if not 0 <= i < len(prompts):
+                        raise ValueError(f"unknown custom_id {i}")
+                    result = entry["result"]
+                    if result["type"] != "succeeded":
+                        print(f"  ⚠️  Batch request {i} {result['type']}")
+                        continue
+                    self._record_usage(result["message"])
+                    text = self._response_text(result["message"])
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    print(f"  ⚠️  Skipping malformed batch result: {e}")
+                    continue
+                responses[i] = text
+                if self.cache and text is not None:
+                    self._cache_response(cache_keys[i], text)
+
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print(f"❌ Claude batch API error: {e}")
+
+        return responses
+
+    def _classify(
+        self,
+        videos: List[Dict],
+        video_info: List[Dict],
+        system_prompt: str,
+        tool: Dict,
+        batch_size: int,
+        verb: str,
+        max_tokens: int = 4000
+    ) -> List[Dict]:
+        """
+        Classify videos in batches and merge Claude's answers into them.
 
-Green flags for MOVIES:
-- Duration 45-180 minutes
-- Plot/story elements in description
-- Character names mentioned
-- Classic movie vocabulary: "starring", "directed by", "film noir", "drama"
+        Videos whose info is identical (the same upload listed twice, or
+        re-uploads with the same metadata) are sent to Claude once and the
+        classification is copied to each of them.
 
-Videos:
-{json.dumps(video_info, indent=2)}
+        Args:
+            videos: Videos to classify (updated in place)
+            video_info: Info sent to Claude for each video, parallel to `videos`
+            system_prompt: Stage rubric
+            tool: Stage tool; Claude must answer through it, and only the
+                fields in its schema are merged into each video
+            batch_size: Number of unique videos per API call
+            verb: Progress message verb, e.g. "Processed"
+            max_tokens: Maximum tokens for each response
 
-Respond with ONLY a valid JSON array of objects in the same order as input:
-[
-  {{"content_type": "MOVIE", "content_confidence": 0.85, "content_reasoning": "Feature-length drama with plot summary"}},
-  {{"content_type": "TRAILER", "content_confidence": 0.95, "content_reasoning": "2-minute duration, title contains 'trailer'"}}
-]"""
+        Returns:
+            `videos`, with classifications merged in where the call succeeded
+        """
+        fields = tuple(
+            field for field in tool["input_schema"]["properties"]["results"]["items"]["properties"]
+            if field != "id"
+        )
+
+        # Map each distinct info (as canonical JSON) to the videos sharing it
+        groups: Dict[str, List[int]] = {}
+        for i, info in enumerate(video_info):
+            groups.setdefault(_CANONICAL_JSON.encode(info), []).append(i)
+        members = list(groups.values())
+        # The canonical JSON doubles as each video's prompt fragment, so
+        # nothing is serialized twice; the id is spliced in as its first key
+        fragments = list(groups)
+
+        batches = [
+            range(i, min(i + batch_size, len(fragments)))
+            for i in range(0, len(fragments), batch_size)
+        ]
+        prompts = [
+            VIDEOS_TEMPLATE % (
+                "[" + ",".join(['{"id":%d,%s' % (k, fragments[j][1:]) for k, j in enumerate(batch)]) + "]"
+            )
+            for batch in batches
+        ]
 
-            response_text = self._call_claude(prompt)
+        if len(fragments) < len(videos):
+            print(f"  ♻️  {len(videos) - len(fragments)} duplicate videos share a classification")
 
+        done = 0
+        for b, response_text in self._call_claude_many(system_prompt, prompts, max_tokens, tool):
+            batch = batches[b]
+            done += len(batch)
             if response_text:
                 try:
-                    # Parse JSON response
-                    classifications = json.loads(response_text)
-
-                    # Merge with original videos
-                    for video, classification in zip(batch, classifications):
-                        video.update(classification)
-                        enhanced_videos.append(video)
-
-                    print(f"  ✅ Processed {len(enhanced_videos)}/{len(videos)} videos")
-
-                except json.JSONDecodeError as e:
+                    classifications = _parse_json_array(response_text)
+
+                    # Merge with original videos; ids index into the batch
+                    for classification in classifications:
+                        if not isinstance(classification, dict):
+                            continue
+                        k = classification.get("id")
+                        if not isinstance(k, int) or not 0 <= k < len(batch):
+                            continue
+                        result = {f: classification[f] for f in fields if f in classification}
+                        for i in members[batch[k]]:
+                            videos[i].update(result)
+
+                    print(f"  ✅ {verb} {done}/{len(fragments)} videos")
+
+                except ValueError as e:
                     print(f"  ⚠️  JSON parse error: {e}")
-                    enhanced_videos.extend(batch)
             else:
                 print(f"  ⚠️  API call failed, keeping batch unclassified")
-                enhanced_videos.extend(batch)
 
-            # Rate limiting
-            time.sleep(1)
+        return videos
 
-        # Filter: Keep only MOVIE content type with confidence > 0.7
-        movies_only = [
-            v for v in enhanced_videos
-            if v.get("content_type") == "MOVIE"
-            and v.get("content_confidence", 0) > 0.7
+    def stage1_content_type_detection(
+        self,
+        videos: List[Dict],
+        batch_size: int = 25
+    ) -> List[Dict]:
+        """
+        Stage 1: Detect content type (movie, trailer, review, promo, etc.).
+
+        Args:
+            videos: List of video dicts with title, description, duration, tags
+            batch_size: Number of videos to process per API call
+
+        Returns:
+            Videos with added fields:
+            - content_type: MOVIE, TRAILER, REVIEW, PROMO, TEST, ESSAY, OTHER
+            - content_confidence: 0.0-1.0 confidence score
+            - content_reasoning: Brief explanation
+        """
+        print(f"\n🎬 Stage 1: Content Type Detection ({len(videos)} videos)")
+        print("=" * 70)
+
+        # Only ambiguous videos are sent to Claude; obvious non-movies
+        # never pass the MOVIE filter anyway
+        ambiguous = self._screen_obvious(videos)
+
+        # Prepare video info with rich metadata (short keys, see STAGE1_RUBRIC)
+        video_info = [
+            {
+                "t": v.get("title", ""),
+                "d": v.get("description", "")[:300],
+                "m": round(v.get("duration", 0) / 60, 1),
+                "tg": v.get("tags", []),
+                "u": v.get("user", ""),
+                "v": v.get("views", 0)
+            }
+            for v in ambiguous
         ]
 
+        enhanced_videos = self._classify(
+            ambiguous, video_info, STAGE1_RUBRIC, STAGE1_TOOL, batch_size, "Processed"
+        )
+
+        # Filter: Keep only MOVIE content type with confidence > 0.7
+        movies_only = [v for v in enhanced_videos if _is_movie(v)]
+
         print(f"\n  📊 Results: {len(movies_only)}/{len(videos)} classified as MOVIE")
         print(f"     Filtered out {len(videos) - len(movies_only)}: trailers, promos, reviews, etc.")
 
@@ -205,91 +907,24 @@ Respond with ONLY a valid JSON array of objects in the same order as input:
         print(f"\n🎭 Stage 2: Feature Film Analysis ({len(videos)} videos)")
         print("=" * 70)
 
-        enhanced_videos = []
-
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i + batch_size]
-
-            video_info = []
-            for v in batch:
-                info = {
-                    "title": v.get("title", ""),
-                    "description": v.get("description", "")[:800],  # Full description
-                    "duration_minutes": round(v.get("duration", 0) / 60, 1),
-                    "content_reasoning": v.get("content_reasoning", ""),
-                    "tags": v.get("tags", [])[:10],
-                    "user": v.get("user", "")
-                }
-                video_info.append(info)
-
-            prompt = f"""These videos were classified as "MOVIE" in initial screening.
-Now verify if they are genuine FEATURE-LENGTH NARRATIVE FILMS.
-
-For each video, determine:
-1. is_feature_film: true/false
-   - TRUE if: Narrative story, character-driven, 40+ minutes, theatrical release quality
-   - FALSE if: Documentary about films, compilation, short film (<40 min), music video
-
-2. has_narrative: true/false
-   - Does it tell a story with characters and plot?
-   - Or is it experimental/abstract/documentary?
-
-3. narrative_confidence: Float 0.0-1.0
-
-4. film_reasoning: 2-3 sentence explanation with specific evidence
-
-Look for POSITIVE indicators:
-- Plot summary or story synopsis in description
-- Character names (not just actor names)
-- Genre keywords: drama, comedy, thriller, western, noir, horror, sci-fi
-- Duration 40-180 minutes
-- "Starring", "directed by", "screenplay", "based on"
-- Film festival mentions, theatrical release info
-
-Look for NEGATIVE indicators:
-- "Documentary about...", "The story of how...", "Behind the scenes"
-- "Supercut", "compilation", "collection", "montage", "tribute"
-- Very short (<40 min) or very long (>200 min) duration
-- "Music video", "concert film", "performance"
-- Educational/instructional content
-- Modern YouTube/Vimeo creator style descriptions
-
-Videos:
-{json.dumps(video_info, indent=2)}
-
-Respond with ONLY valid JSON array:
-[
-  {{"is_feature_film": true, "has_narrative": true, "narrative_confidence": 0.9, "film_reasoning": "Classic noir with plot synopsis mentioning detective protagonist and murder mystery. 87-minute runtime is standard feature length."}},
-  {{"is_feature_film": false, "has_narrative": false, "narrative_confidence": 0.3, "film_reasoning": "Description says 'documentary about classic horror films' - this is a film ABOUT movies, not a movie itself."}}
-]"""
-
-            response_text = self._call_claude(prompt)
-
-            if response_text:
-                try:
-                    classifications = json.loads(response_text)
-
-                    for video, classification in zip(batch, classifications):
-                        video.update(classification)
-                        enhanced_videos.append(video)
-
-                    print(f"  ✅ Analyzed {len(enhanced_videos)}/{len(videos)} videos")
-
-                except json.JSONDecodeError as e:
-                    print(f"  ⚠️  JSON parse error: {e}")
-                    enhanced_videos.extend(batch)
-            else:
-                print(f"  ⚠️  API call failed")
-                enhanced_videos.extend(batch)
+        video_info = [
+            {
+                "t": v.get("title", ""),
+                "d": v.get("description", "")[:800],  # Full description
+                "m": round(v.get("duration", 0) / 60, 1),
+                "cr": v.get("content_reasoning", ""),
+                "tg": v.get("tags", [])[:10],
+                "u": v.get("user", "")
+            }
+            for v in videos
+        ]
 
-            time.sleep(1)
+        enhanced_videos = self._classify(
+            videos, video_info, STAGE2_RUBRIC, STAGE2_TOOL, batch_size, "Analyzed"
+        )
 
         # Filter: Keep only genuine feature films
-        feature_films = [
-            v for v in enhanced_videos
-            if v.get("is_feature_film") == True
-            and v.get("narrative_confidence", 0) > 0.6
-        ]
+        feature_films = [v for v in enhanced_videos if _is_feature_film(v)]
 
         print(f"\n  📊 Results: {len(feature_films)}/{len(videos)} verified as feature films")
         print(f"     Filtered out {len(videos) - len(feature_films)}: documentaries, compilations, shorts")
@@ -322,138 +957,175 @@ Respond with ONLY valid JSON array:
         print(f"\n🎥 Stage 3: Era & Studio Verification ({len(videos)} videos)")
         print("=" * 70)
 
-        enhanced_videos = []
-
-        for i in range(0, len(videos), batch_size):
-            batch = videos[i:i + batch_size]
+        video_info = [
+            {
+                "t": v.get("title", ""),
+                "d": v.get("description", "")[:800],
+                "m": round(v.get("duration", 0) / 60, 1),
+                "up": v.get("created_date", "")[:10],  # Upload date
+                "u": v.get("user", ""),
+                "fr": v.get("film_reasoning", "")
+            }
+            for v in videos
+        ]
 
-            video_info = []
-            for v in batch:
-                info = {
-                    "title": v.get("title", ""),
-                    "description": v.get("description", "")[:800],
-                    "duration_minutes": round(v.get("duration", 0) / 60, 1),
-                    "created_date": v.get("created_date", "")[:10],  # Upload date
-                    "user": v.get("user", ""),
-                    "film_reasoning": v.get("film_reasoning", "")
-                }
-                video_info.append(info)
+        enhanced_videos = self._classify(
+            videos, video_info, STAGE3_RUBRIC, STAGE3_TOOL, batch_size, "Verified"
+        )
 
-            prompt = f"""These are verified feature-length narrative films.
-Determine their production era and studio authenticity.
+        # Filter: Keep only pre-1965 films with quality score >= 6
+        classic_films = [v for v in enhanced_videos if _is_classic(v)]
 
-For each video, determine:
+        print(f"\n  📊 Results: {len(classic_films)}/{len(videos)} verified as pre-1965 classics")
+        print(f"     Filtered out {len(videos) - len(classic_films)}: modern films, uncertain era")
 
-1. estimated_production_year: Best guess of PRODUCTION year (not upload date!)
-   - Analyze title, description for year clues
-   - Look for decade indicators: "1940s classic", "pre-code", "silent era"
-   - Actor/director names can indicate era
-   - Return null if truly uncertain
+        self._print_era_distribution(classic_films)
 
-2. estimated_era: Decade string
-   - "1900s", "1910s", "1920s", "1930s", "1940s", "1950s", "1960s"
-   - "1970s", "1980s", "modern" (1990+)
+        return classic_films
 
-3. is_pre_1965: true/false
-   - Conservative estimate - only true if confident it's pre-1965
+    def stage_all(
+        self,
+        videos: List[Dict],
+        batch_size: int = 8
+    ) -> List[Dict]:
+        """
+        Run all three stages with a single Claude call per batch.
 
-4. production_company: Studio/production company name or null
-   - Extract from description or title
-   - Classic studios: MGM, Paramount, Warner Bros, Universal, RKO, 20th Century Fox, Columbia, United Artists
-   - Independent studios also valid
+        One combined prompt returns the Stage 1, 2 and 3 fields for each
+        video (later fields are null once a video fails an earlier check),
+        and the three stage filters are then applied locally. This sends
+        each video once instead of up to three times.
 
-5. is_formal_studio: true/false
-   - TRUE if produced by recognized studio (major or established independent)
-   - FALSE if amateur, modern indie, or uncertain
-
-6. genre: Primary genre
-   - drama, comedy, thriller, horror, western, noir, sci-fi, romance, war, crime, musical
+        Args:
+            videos: List of video dicts with title, description, duration, tags
+            batch_size: Number of videos to process per API call
 
-7. quality_score: Integer 1-10
-   - How confident are you this is a genuine classic movie worth watching?
-   - Consider: era authenticity, studio legitimacy, genre clarity
-   - 8-10: Highly confident classic
-   - 5-7: Probable classic, some uncertainty
-   - 1-4: Uncertain or likely not a true classic
+        Returns:
+            Verified pre-1965 classics, with the fields of all three stages
+        """
+        print(f"\n🎬 Fused Stages 1-3: Content, Feature Film & Era ({len(videos)} videos)")
+        print("=" * 70)
 
-8. era_reasoning: 2-3 sentences explaining your era/studio determination
+        ambiguous = self._screen_obvious(videos)
+
+        # Short keys, see STAGE_ALL_RUBRIC
+        video_info = [
+            {
+                "t": v.get("title", ""),
+                "d": v.get("description", "")[:800],
+                "m": round(v.get("duration", 0) / 60, 1),
+                "tg": v.get("tags", [])[:10],
+                "u": v.get("user", ""),
+                "v": v.get("views", 0),
+                "up": v.get("created_date", "")[:10]
+            }
+            for v in ambiguous
+        ]
 
-Evidence to look for:
-- Year in title: "Nosferatu (1922)", "The 39 Steps 1935"
-- Era descriptors: "silent film", "pre-code", "golden age", "classic hollywood"
-- Known classic titles: Casablanca, Citizen Kane, Metropolis, etc.
-- Actor names: Chaplin, Bogart, Hepburn, Grant indicate classic era
-- Director names: Hitchcock, Hawks, Ford, Lang, Welles
-- Studio mentions in description
-- "Public domain", "copyright expired" suggests pre-1965
+        enhanced_videos = self._classify(
+            ambiguous, video_info, STAGE_ALL_RUBRIC, STAGE_ALL_TOOL, batch_size, "Classified"
+        )
 
-Be CONSERVATIVE with is_pre_1965 - only mark true if you have good evidence.
+        # Apply the three stage filters in one pass, only counting the
+        # intermediate survivors
+        movie_count = feature_count = 0
+        classic_films = []
+        for v in enhanced_videos:
+            if _is_movie(v):
+                movie_count += 1
+                if _is_feature_film(v):
+                    feature_count += 1
+                    if _is_classic(v):
+                        classic_films.append(v)
 
-Videos:
-{json.dumps(video_info, indent=2)}
-
-Respond with ONLY valid JSON array:
-[
-  {{
-    "estimated_production_year": 1942,
-    "estimated_era": "1940s",
-    "is_pre_1965": true,
-    "production_company": "Warner Bros.",
-    "is_formal_studio": true,
-    "genre": "drama",
-    "quality_score": 9,
-    "era_reasoning": "Title mentions Humphrey Bogart and Ingrid Bergman, iconic 1940s stars. Description references Warner Bros and wartime setting. Almost certainly Casablanca (1942)."
-  }}
-]"""
-
-            response_text = self._call_claude(prompt, max_tokens=4000)
+        print(f"\n  📊 Results: {movie_count}/{len(videos)} classified as MOVIE")
+        print(f"     {feature_count} verified as feature films")
+        print(f"     {len(classic_films)} verified as pre-1965 classics")
 
-            if response_text:
-                try:
-                    classifications = json.loads(response_text)
+        self._print_era_distribution(classic_films)
 
-                    for video, classification in zip(batch, classifications):
-                        video.update(classification)
-                        enhanced_videos.append(video)
+        return classic_films
 
-                    print(f"  ✅ Verified {len(enhanced_videos)}/{len(videos)} videos")
+    @staticmethod
+    def _screen_obvious(videos: List[Dict]) -> List[Dict]:
+        """
+        Settle obvious non-movies locally (see _cheap_classify).
 
-                except json.JSONDecodeError as e:
-                    print(f"  ⚠️  JSON parse error: {e}")
-                    enhanced_videos.extend(batch)
+        Returns:
+            The videos that still need Claude, in their original order
+        """
+        ambiguous = []
+        for v in videos:
+            classification = _cheap_classify(v)
+            if classification:
+                v.update(classification)
             else:
-                print(f"  ⚠️  API call failed")
-                enhanced_videos.extend(batch)
+                ambiguous.append(v)
 
-            time.sleep(1)
+        if len(ambiguous) < len(videos):
+            print(f"  ⚡ {len(videos) - len(ambiguous)} obvious non-movies classified without Claude")
+        return ambiguous
 
-        # Filter: Keep only pre-1965 films with quality score >= 6
-        classic_films = [
-            v for v in enhanced_videos
-            if v.get("is_pre_1965") == True
-            and v.get("quality_score", 0) >= 6
-        ]
-
-        print(f"\n  📊 Results: {len(classic_films)}/{len(videos)} verified as pre-1965 classics")
-        print(f"     Filtered out {len(videos) - len(classic_films)}: modern films, uncertain era")
-
-        # Show era distribution
-        era_counts = {}
-        for v in classic_films:
-            era = v.get("estimated_era", "unknown")
-            era_counts[era] = era_counts.get(era, 0) + 1
+    @staticmethod
+    def _print_era_distribution(films: List[Dict]):
+        """Print how many films fall in each estimated era."""
+        era_counts = Counter(v.get("estimated_era") or "unknown" for v in films)
 
         print(f"\n  📅 Era distribution:")
         for era, count in sorted(era_counts.items()):
             print(f"     {era}: {count} films")
 
-        return classic_films
+    def _verify_chunk(
+        self,
+        videos: List[Dict],
+        skip_stage1: bool,
+        skip_stage2: bool
+    ) -> List[Dict]:
+        """Run one chunk of videos through the staged pipeline."""
+        results = videos
+        if results and not skip_stage1:
+            results = self.stage1_content_type_detection(results)
+        if results and not skip_stage2:
+            results = self.stage2_feature_film_analysis(results)
+        if results:
+            results = self.stage3_era_studio_verification(results)
+        return results
+
+    def _verify_pipelined(
+        self,
+        videos: List[Dict],
+        chunk_size: int,
+        skip_stage1: bool,
+        skip_stage2: bool
+    ) -> List[Dict]:
+        """
+        Run the staged pipeline over chunks of videos concurrently.
+
+        Chunks are fixed slices of the input, so batch contents (and the
+        response cache) stay the same from run to run. The shared
+        connection pool still caps calls in flight at `max_concurrency`.
+
+        Returns:
+            Verified classics from every chunk, in input order
+        """
+        chunks = [videos[i:i + chunk_size] for i in range(0, len(videos), chunk_size)]
+        with ThreadPoolExecutor(max_workers=max(1, min(len(chunks), self.max_concurrency))) as executor:
+            return [
+                video
+                for chunk_results in executor.map(
+                    lambda chunk: self._verify_chunk(chunk, skip_stage1, skip_stage2),
+                    chunks
+                )
+                for video in chunk_results
+            ]
 
     def verify_full_pipeline(
         self,
         videos: List[Dict],
         skip_stage1: bool = False,
-        skip_stage2: bool = False
+        skip_stage2: bool = False,
+        fused: bool = False,
+        chunk_size: Optional[int] = None
     ) -> List[Dict]:
         """
         Run complete three-stage verification pipeline.
@@ -462,6 +1134,12 @@ Respond with ONLY valid JSON array:
             videos: Raw videos from Vimeo
             skip_stage1: Skip content type detection (use if already filtered)
             skip_stage2: Skip feature film analysis (use if already verified)
+            fused: Run all three stages in one call per batch (stage_all);
+                the skip flags are ignored
+            chunk_size: Pipeline the staged run: split the videos into
+                chunks of this size and run each chunk through the stages
+                concurrently, so later stages start before Stage 1 has
+                seen every video (progress output interleaves)
 
         Returns:
             Fully verified classic movies
@@ -473,25 +1151,39 @@ Respond with ONLY valid JSON array:
 
         results = videos
 
-        if not skip_stage1:
-            results = self.stage1_content_type_detection(results)
-            if not results:
-                print("\n❌ No videos passed Stage 1 (Content Type Detection)")
-                return []
-
-        if not skip_stage2:
-            results = self.stage2_feature_film_analysis(results)
-            if not results:
-                print("\n❌ No videos passed Stage 2 (Feature Film Analysis)")
-                return []
-
-        results = self.stage3_era_studio_verification(results)
+        if fused:
+            results = self.stage_all(results)
+        elif chunk_size:
+            results = self._verify_pipelined(results, chunk_size, skip_stage1, skip_stage2)
+        else:
+            if not skip_stage1:
+                results = self.stage1_content_type_detection(results)
+                if not results:
+                    print("\n❌ No videos passed Stage 1 (Content Type Detection)")
+                    return []
+
+            if not skip_stage2:
+                results = self.stage2_feature_film_analysis(results)
+                if not results:
+                    print("\n❌ No videos passed Stage 2 (Feature Film Analysis)")
+                    return []
+
+            results = self.stage3_era_studio_verification(results)
 
         print(f"\n{'='*70}")
         print(f"✅ PIPELINE COMPLETE")
         print(f"{'='*70}")
         print(f"Final results: {len(results)} verified classic movies")
         print(f"Success rate: {len(results)}/{len(videos)} ({len(results)/len(videos)*100:.1f}%)")
+        if self.cache:
+            stats = self.cache.cache_stats
+            print(f"Response cache: {stats['hits']} hits, {stats['misses']} misses")
+        if self.usage:
+            print(
+                f"Input tokens: {self.usage['input_tokens']} uncached, "
+                f"{self.usage['cache_read_input_tokens']} read from prompt cache, "
+                f"{self.usage['cache_creation_input_tokens']} written to prompt cache"
+            )
 
         return results
 
@@ -18,9 +18,16 @@ Pipeline stages:
 
 import os
 import csv
+import logging
+import argparse
+import sys
+import re
 import json
 import time
-from typing import List, Dict
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -28,6 +35,62 @@ from dotenv import load_dotenv
 from vimeo_old_movies_finder import VimeoMovieFinder
 from ai_powered_movie_verifier import AIMovieVerifier
 from tmdb_verifier import TMDbVerifier
+from llm_cache import LLMCache
+
+# Read .env once per process, at import (run.py imports this module)
+load_dotenv()
+
+log = logging.getLogger("pipeline")
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Tunable pipeline settings; use dataclasses.replace() to override some."""
+
+    min_duration: int = 45 * 60  # 45 minutes in seconds
+    max_duration: int = 180 * 60  # 3 hours in seconds
+    per_query_results: int = 5  # Results per search query
+    min_tmdb_confidence: int = 70  # Minimum TMDb confidence score
+    min_ai_quality: int = 6  # Minimum AI quality score (1-10)
+    search_concurrency: int = 8  # Vimeo queries in flight at once
+    tmdb_concurrency: int = 8  # TMDb verifications in flight at once
+    ai_concurrency: int = 8  # Claude batch calls in flight at once
+    ai_requests_per_minute: int = 50  # Starting Claude rate (synced from headers)
+    max_description_chars: int = 800  # Longest description kept past Stage 1
+    cache_ttl_days: int = 30  # Reuse cached Claude/TMDb responses this long
+    search_cache_ttl_days: int = 1  # Vimeo results change faster
+
+
+# Stage 6 CSV columns, in order; _csv_row builds its rows to match
+CSV_FIELDS = (
+    # Basic info
+    "title", "url", "duration_minutes", "duration_formatted",
+    # AI classification
+    "estimated_production_year", "estimated_era", "genre", "production_company",
+    "is_formal_studio", "ai_quality_score",
+    # TMDb verification
+    "tmdb_verified", "tmdb_id", "tmdb_title", "tmdb_release_year",
+    "tmdb_runtime_minutes", "tmdb_studios", "tmdb_confidence",
+    # Metadata
+    "views", "likes", "comments", "created_date", "user", "user_url", "tags", "categories",
+    # Scoring
+    "final_score",
+    # Descriptions
+    "description",
+)
+
+# Stage 5 scoring tables. Duration bands are checked in order (the first
+# band containing the runtime wins); view points come from the highest
+# threshold reached, looked up by bisection.
+DURATION_BANDS = ((70, 120, 10), (60, 150, 7), (45, 180, 4))
+VIEW_THRESHOLDS = (1000, 10000, 50000, 100000)
+VIEW_POINTS = (0, 3, 5, 7, 10)
+
+
+def _video_id(url: str):
+    """Numeric Vimeo id from a video URL (the URL itself if it has none)."""
+    tail = url.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else url
 
 
 class ComprehensiveMovieFinder:
@@ -48,6 +111,14 @@ class ComprehensiveMovieFinder:
         "campaign", "ad", "commercial", "spot"
     ]
 
+    # All keywords in one pattern, so each video is scanned once. Whole
+    # words only: a bare substring test let "ad" match "made" or "road".
+    # Keywords are casefolded here and text is casefolded per video, so the
+    # scan itself is case-sensitive.
+    _BLACKLIST_RE = re.compile(
+        r"\b(" + "|".join(re.escape(k.casefold()) for k in BLACKLIST_KEYWORDS) + r")\b"
+    )
+
     # Enhanced search queries targeting known classics and eras
     SEARCH_QUERIES = [
         # Known classic films
@@ -93,7 +164,9 @@ class ComprehensiveMovieFinder:
         self,
         vimeo_token: str,
         claude_api_key: str,
-        tmdb_api_key: str
+        tmdb_api_key: str,
+        use_cache: bool = True,
+        config: Optional[PipelineConfig] = None
     ):
         """
         Initialize comprehensive finder with all API credentials.
@@ -102,18 +175,29 @@ class ComprehensiveMovieFinder:
             vimeo_token: Vimeo API token
             claude_api_key: Anthropic Claude API key
             tmdb_api_key: The Movie Database API key
+            use_cache: Reuse Vimeo, Claude and TMDb responses cached by
+                earlier runs
+            config: Pipeline settings (defaults if None)
         """
-        self.vimeo_finder = VimeoMovieFinder(vimeo_token)
-        self.ai_verifier = AIMovieVerifier(claude_api_key)
-        self.tmdb_verifier = TMDbVerifier(tmdb_api_key)
-
-        self.config = {
-            "min_duration": 45 * 60,  # 45 minutes in seconds
-            "max_duration": 180 * 60,  # 3 hours in seconds
-            "per_query_results": 5,  # Results per search query
-            "min_tmdb_confidence": 70,  # Minimum TMDb confidence score
-            "min_ai_quality": 6,  # Minimum AI quality score (1-10)
+        self.config = config or PipelineConfig()
+
+        ttl = self.config.cache_ttl_days
+        ai_options = {
+            "max_concurrency": self.config.ai_concurrency,
+            "requests_per_minute": self.config.ai_requests_per_minute,
         }
+        self.vimeo_finder = VimeoMovieFinder(vimeo_token)
+        if use_cache:
+            self.ai_verifier = AIMovieVerifier(claude_api_key, cache_ttl_days=ttl, **ai_options)
+            self.tmdb_verifier = TMDbVerifier(tmdb_api_key, cache_ttl_days=ttl)
+            self.search_cache = LLMCache(
+                os.path.join("outputs", ".vimeo_search_cache.sqlite"),
+                self.config.search_cache_ttl_days
+            )
+        else:
+            self.ai_verifier = AIMovieVerifier(claude_api_key, cache_path=None, **ai_options)
+            self.tmdb_verifier = TMDbVerifier(tmdb_api_key, cache_path=None)
+            self.search_cache = None
 
     def stage1_vimeo_search(self, queries: List[str] = None) -> List[Dict]:
         """
@@ -128,48 +212,106 @@ class ComprehensiveMovieFinder:
         if queries is None:
             queries = self.SEARCH_QUERIES
 
-        print(f"\n{'='*70}")
-        print("🔍 STAGE 1: VIMEO SEARCH")
-        print(f"{'='*70}")
-        print(f"Searching {len(queries)} queries...")
-        print(f"Duration filter: {self.config['min_duration']//60}-{self.config['max_duration']//60} minutes")
-
-        all_videos = []
-        seen_urls = set()
-
-        for i, query in enumerate(queries, 1):
-            print(f"\n[{i}/{len(queries)}] Query: '{query}'")
+        log.info(f"\n{'='*70}")
+        log.info("🔍 STAGE 1: VIMEO SEARCH")
+        log.info(f"{'='*70}")
+        log.info(f"Searching {len(queries)} queries...")
+        log.info(f"Duration filter: {self.config.min_duration//60}-{self.config.max_duration//60} minutes")
+
+        def search(query: str) -> List[Dict]:
+            # Word order and case don't change Vimeo's relevance results
+            # much, so reworded queries share one cache entry
+            if self.search_cache:
+                cache_key = LLMCache.make_key(
+                    "vimeo_search_v1",
+                    " ".join(sorted(query.casefold().split())),
+                    str(self.config.per_query_results)
+                )
+                cached = self.search_cache.get(cache_key)
+                if cached is not None:
+                    return json.loads(cached)
 
             videos = self.vimeo_finder.search_videos(
                 query,
-                per_page=self.config["per_query_results"],
-                max_results=self.config["per_query_results"]
+                per_page=self.config.per_query_results,
+                max_results=self.config.per_query_results
             )
 
-            # Deduplicate and apply duration filter
+            # An empty list may just be a failed request, so don't keep it
+            if self.search_cache and videos:
+                self.search_cache.set(cache_key, json.dumps(videos, ensure_ascii=False))
+            return videos
+
+        # Queries are pure network waits, so run a bounded number at once.
+        # map() keeps results in query order so deduplication stays stable.
+        with ThreadPoolExecutor(max_workers=self.config.search_concurrency) as executor:
+            results = list(executor.map(search, queries))
+
+        min_duration = self.config.min_duration
+        max_duration = self.config.max_duration
+        max_description = self.config.max_description_chars
+        all_videos = []
+        seen_ids = set()
+
+        for i, (query, videos) in enumerate(zip(queries, results), 1):
+            log.info(f"\n[{i}/{len(queries)}] Query: '{query}' -> {len(videos)} results")
+
+            # Duration filter first (cheapest), then deduplicate
             for video in videos:
-                url = video["url"]
                 duration = video["duration"]
-
-                # Duration filter
-                if duration < self.config["min_duration"]:
-                    continue
-                if duration > self.config["max_duration"]:
+                if not min_duration <= duration <= max_duration:
                     continue
 
-                # Deduplicate
-                if url not in seen_urls:
-                    all_videos.append(video)
-                    seen_urls.add(url)
+                video_id = _video_id(video["url"])
+                if video_id in seen_ids:
+                    continue
+                seen_ids.add(video_id)
 
-            time.sleep(1)  # Rate limiting
+                # Whole minutes, computed once here for the export
+                video["duration_minutes"] = duration // 60
+                # No later stage reads past this, so don't carry the rest
+                video["description"] = (video.get("description") or "")[:max_description]
+                all_videos.append(video)
 
-        print(f"\n{'='*70}")
-        print(f"✅ Found {len(all_videos)} videos (after duration filtering + deduplication)")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info(f"✅ Found {len(all_videos)} videos (after duration filtering + deduplication)")
+        if self.search_cache:
+            stats = self.search_cache.cache_stats
+            log.info(f"   Search cache: {stats['hits']} hits, {stats['misses']} misses")
+        log.info(f"{'='*70}")
 
         return all_videos
 
+    def iter_keyword_prefilter(self, videos: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Yield the videos that contain no blacklisted keyword.
+
+        Works on any iterable, one video at a time, so callers can stream
+        candidates through without building intermediate lists.
+
+        Args:
+            videos: Candidate videos
+
+        Yields:
+            Videos that passed the filter, in input order
+        """
+        for video in videos:
+            # Title, description and tags normalized once into one string
+            blob = "\n".join((
+                video.get("title") or "",
+                video.get("description") or "",
+                *video.get("tags", [])
+            )).casefold()
+
+            # Check for blacklisted keywords
+            match = self._BLACKLIST_RE.search(blob)
+            if match is None:
+                yield video
+            else:
+                # Per-video detail is off by default; the arguments are only
+                # formatted when --verbose turns debug output on
+                log.debug("  ❌ Filtered: '%s' (contains '%s')", video["title"][:60], match.group(1))
+
     def stage2_keyword_prefilter(self, videos: List[Dict]) -> List[Dict]:
         """
         Stage 2: Quick keyword-based filtering to eliminate obvious non-movies.
@@ -180,36 +322,18 @@ class ComprehensiveMovieFinder:
         Returns:
             Filtered videos
         """
-        print(f"\n{'='*70}")
-        print("🔎 STAGE 2: KEYWORD PRE-FILTER")
-        print(f"{'='*70}")
-
-        filtered = []
-
-        for video in videos:
-            title = video.get("title", "").lower()
-            description = video.get("description", "").lower()
-            tags = [t.lower() for t in video.get("tags", [])]
+        log.info(f"\n{'='*70}")
+        log.info("🔎 STAGE 2: KEYWORD PRE-FILTER")
+        log.info(f"{'='*70}")
 
-            # Check for blacklisted keywords
-            has_blacklist = False
-            matched_keyword = None
-
-            for keyword in self.BLACKLIST_KEYWORDS:
-                if keyword in title or keyword in description or keyword in " ".join(tags):
-                    has_blacklist = True
-                    matched_keyword = keyword
-                    break
+        # Materialized once: the AI stage batches and deduplicates across
+        # the whole set
+        filtered = list(self.iter_keyword_prefilter(videos))
 
-            if has_blacklist:
-                print(f"  ❌ Filtered: '{video['title'][:60]}' (contains '{matched_keyword}')")
-            else:
-                filtered.append(video)
-
-        print(f"\n{'='*70}")
-        print(f"✅ Passed: {len(filtered)}/{len(videos)} videos")
-        print(f"   Filtered out {len(videos) - len(filtered)} videos with blacklist keywords")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info(f"✅ Passed: {len(filtered)}/{len(videos)} videos")
+        log.info(f"   Filtered out {len(videos) - len(filtered)} videos with blacklist keywords")
+        log.info(f"{'='*70}")
 
         return filtered
 
@@ -223,9 +347,9 @@ class ComprehensiveMovieFinder:
         Returns:
             AI-verified classic movies
         """
-        print(f"\n{'='*70}")
-        print("🤖 STAGE 3: AI CLASSIFICATION (3 sub-stages)")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info("🤖 STAGE 3: AI CLASSIFICATION (3 sub-stages)")
+        log.info(f"{'='*70}")
 
         verified_movies = self.ai_verifier.verify_full_pipeline(videos)
 
@@ -241,25 +365,25 @@ class ComprehensiveMovieFinder:
         Returns:
             TMDb-verified movies with confidence scores
         """
-        print(f"\n{'='*70}")
-        print("🎬 STAGE 4: TMDB VERIFICATION")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info("🎬 STAGE 4: TMDB VERIFICATION")
+        log.info(f"{'='*70}")
 
         verified_movies = self.tmdb_verifier.batch_verify(
             videos,
-            delay=0.3
+            max_workers=self.config.tmdb_concurrency
         )
 
         # Filter by TMDb confidence threshold
         high_confidence = [
             v for v in verified_movies
-            if v.get("tmdb_verification", {}).get("confidence", 0) >= self.config["min_tmdb_confidence"]
+            if v.get("tmdb_verification", {}).get("confidence", 0) >= self.config.min_tmdb_confidence
         ]
 
-        print(f"\n{'='*70}")
-        print(f"✅ High confidence matches: {len(high_confidence)}/{len(videos)}")
-        print(f"   (TMDb confidence >= {self.config['min_tmdb_confidence']}%)")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info(f"✅ High confidence matches: {len(high_confidence)}/{len(videos)}")
+        log.info(f"   (TMDb confidence >= {self.config.min_tmdb_confidence}%)")
+        log.info(f"{'='*70}")
 
         return high_confidence
 
@@ -280,43 +404,33 @@ class ComprehensiveMovieFinder:
         Returns:
             Ranked movies with final_score field
         """
-        print(f"\n{'='*70}")
-        print("📊 STAGE 5: SCORING & RANKING")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info("📊 STAGE 5: SCORING & RANKING")
+        log.info(f"{'='*70}")
 
         for video in videos:
-            score = 0.0
+            tmdb = video.get("tmdb_verification", {})
 
             # AI quality score (0-40 points)
-            ai_quality = video.get("quality_score", 0)
-            score += (ai_quality / 10) * 40
+            score = (video.get("quality_score", 0) / 10) * 40
 
             # TMDb confidence (0-30 points)
-            tmdb_confidence = video.get("tmdb_verification", {}).get("confidence", 0)
-            score += (tmdb_confidence / 100) * 30
+            score += (tmdb.get("confidence", 0) / 100) * 30
 
             # Duration appropriateness (0-10 points)
+            # Exact minutes, so band edges score as before (120m30s is
+            # past 120; whole minutes would round it into the band)
             duration_min = (video.get("duration") or 0) / 60
-            if 70 <= duration_min <= 120:  # Sweet spot for classic films
-                score += 10
-            elif 60 <= duration_min <= 150:
-                score += 7
-            elif 45 <= duration_min <= 180:
-                score += 4
+            for low, high, points in DURATION_BANDS:
+                if low <= duration_min <= high:
+                    score += points
+                    break
 
             # View count - popularity signal (0-10 points)
-            views = video.get("views") or 0  # Handle None values
-            if views >= 100000:
-                score += 10
-            elif views >= 50000:
-                score += 7
-            elif views >= 10000:
-                score += 5
-            elif views >= 1000:
-                score += 3
+            score += VIEW_POINTS[bisect_right(VIEW_THRESHOLDS, video.get("views") or 0)]
 
             # TMDb verified status bonus (0-10 points)
-            if video.get("tmdb_verification", {}).get("verified"):
+            if tmdb.get("verified"):
                 score += 10
 
             video["final_score"] = round(score, 1)
@@ -324,15 +438,61 @@ class ComprehensiveMovieFinder:
         # Sort by final score (descending)
         videos.sort(key=lambda v: v["final_score"], reverse=True)
 
-        print(f"✅ Scored and ranked {len(videos)} movies")
-        print(f"\nTop 5 movies by confidence:")
+        log.info(f"✅ Scored and ranked {len(videos)} movies")
+        log.info(f"\nTop 5 movies by confidence:")
         for i, v in enumerate(videos[:5], 1):
-            print(f"  {i}. {v['title'][:50]} - Score: {v['final_score']}/100")
+            log.info(f"  {i}. {v['title'][:50]} - Score: {v['final_score']}/100")
 
-        print(f"\n{'='*70}")
+        log.info(f"\n{'='*70}")
 
         return videos
 
+    @staticmethod
+    def _csv_row(video: Dict) -> Tuple:
+        """Flatten a scored video into one CSV row, in CSV_FIELDS order."""
+        tmdb = video.get("tmdb_verification", {})
+
+        return (
+            # Basic info
+            video.get("title", ""),
+            video.get("url", ""),
+            video.get("duration_minutes", 0),
+            video.get("duration_formatted", ""),
+
+            # AI classification
+            video.get("estimated_production_year"),
+            video.get("estimated_era", ""),
+            video.get("genre", ""),
+            video.get("production_company", ""),
+            video.get("is_formal_studio", False),
+            video.get("quality_score", 0),
+
+            # TMDb verification
+            tmdb.get("verified", False),
+            tmdb.get("tmdb_id"),
+            tmdb.get("tmdb_title", ""),
+            tmdb.get("release_year"),
+            tmdb.get("runtime_minutes"),
+            ", ".join(tmdb.get("production_companies", [])),
+            tmdb.get("confidence", 0),
+
+            # Metadata
+            video.get("views") or 0,
+            video.get("likes") or 0,
+            video.get("comments") or 0,
+            video.get("created_date", ""),
+            video.get("user", ""),
+            video.get("user_url", ""),
+            ", ".join(video.get("tags", [])),
+            ", ".join(video.get("categories", [])),
+
+            # Scoring
+            video.get("final_score", 0),
+
+            # Descriptions
+            video.get("description", "")[:500],  # Limit for CSV
+        )
+
     def stage6_export(
         self,
         videos: List[Dict],
@@ -345,9 +505,9 @@ class ComprehensiveMovieFinder:
             videos: Ranked and scored movies
             output_dir: Output directory path
         """
-        print(f"\n{'='*70}")
-        print("💾 STAGE 6: EXPORT RESULTS")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info("💾 STAGE 6: EXPORT RESULTS")
+        log.info(f"{'='*70}")
 
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
@@ -356,73 +516,27 @@ class ComprehensiveMovieFinder:
         csv_path = os.path.join(output_dir, f"verified_classic_movies_{timestamp}.csv")
         json_path = os.path.join(output_dir, f"verified_classic_movies_{timestamp}.json")
 
-        # Prepare flattened data for CSV
-        csv_rows = []
-        for video in videos:
-            tmdb = video.get("tmdb_verification", {})
-
-            row = {
-                # Basic info
-                "title": video.get("title", ""),
-                "url": video.get("url", ""),
-                "duration_minutes": round((video.get("duration") or 0) / 60),
-                "duration_formatted": video.get("duration_formatted", ""),
-
-                # AI classification
-                "estimated_production_year": video.get("estimated_production_year"),
-                "estimated_era": video.get("estimated_era", ""),
-                "genre": video.get("genre", ""),
-                "production_company": video.get("production_company", ""),
-                "is_formal_studio": video.get("is_formal_studio", False),
-                "ai_quality_score": video.get("quality_score", 0),
-
-                # TMDb verification
-                "tmdb_verified": tmdb.get("verified", False),
-                "tmdb_id": tmdb.get("tmdb_id"),
-                "tmdb_title": tmdb.get("tmdb_title", ""),
-                "tmdb_release_year": tmdb.get("release_year"),
-                "tmdb_runtime_minutes": tmdb.get("runtime_minutes"),
-                "tmdb_studios": ", ".join(tmdb.get("production_companies", [])),
-                "tmdb_confidence": tmdb.get("confidence", 0),
-
-                # Metadata
-                "views": video.get("views") or 0,
-                "likes": video.get("likes") or 0,
-                "comments": video.get("comments") or 0,
-                "created_date": video.get("created_date", ""),
-                "user": video.get("user", ""),
-                "user_url": video.get("user_url", ""),
-                "tags": ", ".join(video.get("tags", [])),
-                "categories": ", ".join(video.get("categories", [])),
-
-                # Scoring
-                "final_score": video.get("final_score", 0),
-
-                # Descriptions
-                "description": video.get("description", "")[:500],  # Limit for CSV
-            }
-
-            csv_rows.append(row)
-
-        # Write CSV
-        if csv_rows:
+        # Write CSV one row at a time instead of building every row first
+        if videos:
             with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=csv_rows[0].keys())
-                writer.writeheader()
-                writer.writerows(csv_rows)
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                for video in videos:
+                    writer.writerow(self._csv_row(video))
 
-            print(f"✅ Saved CSV: {csv_path}")
+            log.info(f"✅ Saved CSV: {csv_path}")
 
-        # Write JSON (full data)
+        # Write JSON (full data). Compact one-shot dumps() uses the C
+        # encoder; the CSV above is the human-readable export.
         with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(videos, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(videos, separators=(",", ":"), ensure_ascii=False))
 
-        print(f"✅ Saved JSON: {json_path}")
+        log.info(f"✅ Saved JSON: {json_path}")
 
-        print(f"\n{'='*70}")
-        print(f"📈 FINAL STATISTICS")
-        print(f"{'='*70}")
-        print(f"Total verified classic movies: {len(videos)}")
+        log.info(f"\n{'='*70}")
+        log.info(f"📈 FINAL STATISTICS")
+        log.info(f"{'='*70}")
+        log.info(f"Total verified classic movies: {len(videos)}")
 
         # Era breakdown
         era_counts = {}
@@ -430,22 +544,22 @@ class ComprehensiveMovieFinder:
             era = v.get("estimated_era", "unknown")
             era_counts[era] = era_counts.get(era, 0) + 1
 
-        print(f"\nMovies by era:")
+        log.info(f"\nMovies by era:")
         for era, count in sorted(era_counts.items()):
-            print(f"  {era}: {count} movies")
+            log.info(f"  {era}: {count} movies")
 
         # TMDb verification rate
         tmdb_verified = sum(1 for v in videos if v.get("tmdb_verification", {}).get("verified"))
-        print(f"\nTMDb verification rate: {tmdb_verified}/{len(videos)} ({tmdb_verified/len(videos)*100:.1f}%)")
+        log.info(f"\nTMDb verification rate: {tmdb_verified}/{len(videos)} ({tmdb_verified/len(videos)*100:.1f}%)")
 
         # Average scores
         avg_final = sum(v.get("final_score", 0) for v in videos) / len(videos) if videos else 0
         avg_ai = sum(v.get("quality_score", 0) for v in videos) / len(videos) if videos else 0
 
-        print(f"\nAverage final score: {avg_final:.1f}/100")
-        print(f"Average AI quality: {avg_ai:.1f}/10")
+        log.info(f"\nAverage final score: {avg_final:.1f}/100")
+        log.info(f"Average AI quality: {avg_ai:.1f}/10")
 
-        print(f"\n{'='*70}")
+        log.info(f"\n{'='*70}")
 
     def run_full_pipeline(
         self,
@@ -464,45 +578,47 @@ class ComprehensiveMovieFinder:
         """
         start_time = time.time()
 
-        print("\n")
-        print("=" * 70)
-        print("🎬 COMPREHENSIVE CLASSIC MOVIE FINDER")
-        print("=" * 70)
-        print("AI-First Pipeline for Authentic Pre-1965 Feature Films")
-        print("=" * 70)
-        print(f"\nConfiguration:")
-        print(f"  Duration range: {self.config['min_duration']//60}-{self.config['max_duration']//60} minutes")
-        print(f"  Results per query: {self.config['per_query_results']}")
-        print(f"  Min TMDb confidence: {self.config['min_tmdb_confidence']}%")
-        print(f"  Min AI quality: {self.config['min_ai_quality']}/10")
-        print()
+        log.info("\n")
+        log.info("=" * 70)
+        log.info("🎬 COMPREHENSIVE CLASSIC MOVIE FINDER")
+        log.info("=" * 70)
+        log.info("AI-First Pipeline for Authentic Pre-1965 Feature Films")
+        log.info("=" * 70)
+        log.info(f"\nConfiguration:")
+        log.info(f"  Duration range: {self.config.min_duration//60}-{self.config.max_duration//60} minutes")
+        log.info(f"  Results per query: {self.config.per_query_results}")
+        log.info(f"  Search concurrency: {self.config.search_concurrency}")
+        log.info(f"  AI concurrency: {self.config.ai_concurrency}")
+        log.info(f"  Min TMDb confidence: {self.config.min_tmdb_confidence}%")
+        log.info(f"  Min AI quality: {self.config.min_ai_quality}/10")
+        log.info("")
 
         # Stage 1: Vimeo Search
         videos = self.stage1_vimeo_search(queries)
 
         if not videos:
-            print("\n❌ No videos found in Stage 1. Exiting.")
+            log.info("\n❌ No videos found in Stage 1. Exiting.")
             return []
 
         # Stage 2: Keyword Pre-filter
         videos = self.stage2_keyword_prefilter(videos)
 
         if not videos:
-            print("\n❌ No videos passed Stage 2. Exiting.")
+            log.info("\n❌ No videos passed Stage 2. Exiting.")
             return []
 
         # Stage 3: AI Classification (3 sub-stages)
         videos = self.stage3_ai_classification(videos)
 
         if not videos:
-            print("\n❌ No videos passed Stage 3 (AI). Exiting.")
+            log.info("\n❌ No videos passed Stage 3 (AI). Exiting.")
             return []
 
         # Stage 4: TMDb Verification
         videos = self.stage4_tmdb_verification(videos)
 
         if not videos:
-            print("\n❌ No videos passed Stage 4 (TMDb). Exiting.")
+            log.info("\n❌ No videos passed Stage 4 (TMDb). Exiting.")
             return []
 
         # Stage 5: Scoring & Ranking
@@ -512,15 +628,33 @@ class ComprehensiveMovieFinder:
         self.stage6_export(videos, output_dir)
 
         elapsed = time.time() - start_time
-        print(f"\n⏱️  Total pipeline time: {elapsed/60:.1f} minutes")
-        print(f"✅ Pipeline complete! Found {len(videos)} verified classic movies.\n")
+        log.info(f"\n⏱️  Total pipeline time: {elapsed/60:.1f} minutes")
+        log.info(f"✅ Pipeline complete! Found {len(videos)} verified classic movies.\n")
 
         return videos
 
 
 def main():
     """Main entry point."""
-    load_dotenv()
+    parser = argparse.ArgumentParser(description="Find verified classic movies on Vimeo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't write the Claude/TMDb response caches"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also show per-video detail, such as each keyword-filtered title"
+    )
+    args = parser.parse_args()
+
+    # Plain messages on stdout, in step with the verifiers' own output
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
 
     # Load API keys
     vimeo_token = os.getenv("VIMEO_API_TOKEN")
@@ -537,27 +671,28 @@ def main():
         missing.append("TMDB_API_KEY")
 
     if missing:
-        print("❌ Error: Missing required API keys in .env file:")
+        log.info("❌ Error: Missing required API keys in .env file:")
         for key in missing:
-            print(f"   - {key}")
-        print("\nPlease add these keys to your .env file.")
-        print("See .env.example for reference.")
+            log.info(f"   - {key}")
+        log.info("\nPlease add these keys to your .env file.")
+        log.info("See .env.example for reference.")
         return
 
     # Initialize finder
     finder = ComprehensiveMovieFinder(
         vimeo_token=vimeo_token,
         claude_api_key=claude_api_key,
-        tmdb_api_key=tmdb_api_key
+        tmdb_api_key=tmdb_api_key,
+        use_cache=not args.no_cache
     )
 
     # Run pipeline
     verified_movies = finder.run_full_pipeline()
 
     if verified_movies:
-        print("\n🎉 Success! Check the ./outputs directory for results.")
+        log.info("\n🎉 Success! Check the ./outputs directory for results.")
     else:
-        print("\n⚠️  No movies found. Try adjusting search queries or filters.")
+        log.info("\n⚠️  No movies found. Try adjusting search queries or filters.")
 
 
 if __name__ == "__main__":
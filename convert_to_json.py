@@ -3,32 +3,26 @@
 import csv
 import json
 
+from vimeo_old_movies_finder import format_duration
+
+
+def _to_int(value, default):
+    """Parse a CSV cell as an int, falling back to `default` if blank or invalid"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 # Read CSV
 movies = []
 with open('outputs/vimeo_movies_ai_enhanced.csv', 'r', encoding='utf-8') as f:
     reader = csv.DictReader(f)
     for row in reader:
         # Convert numeric fields
-        duration = 0
-        if row.get('duration'):
-            try:
-                duration = int(row['duration'])
-            except ValueError:
-                duration = 0
-
-        views = None
-        if row.get('views') and row['views'].strip():
-            try:
-                views = int(row['views'])
-            except ValueError:
-                views = None
-
-        relevance_score = 0
-        if row.get('relevance_score'):
-            try:
-                relevance_score = int(row['relevance_score'])
-            except ValueError:
-                relevance_score = 0
+        duration = _to_int(row.get('duration'), 0)
+        views = _to_int(row.get('views'), None)
+        relevance_score = _to_int(row.get('relevance_score'), 0)
 
         # Convert boolean
         is_old_movie = False
@@ -36,16 +30,7 @@ with open('outputs/vimeo_movies_ai_enhanced.csv', 'r', encoding='utf-8') as f:
             is_old_movie = row['is_old_movie'].lower() == 'true'
 
         # Format duration
-        if duration:
-            hours = duration // 3600
-            minutes = (duration % 3600) // 60
-            seconds = duration % 60
-            if hours > 0:
-                duration_formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            else:
-                duration_formatted = f"{minutes:02d}:{seconds:02d}"
-        else:
-            duration_formatted = "0:00"
+        duration_formatted = format_duration(duration) if duration else "0:00"
 
         # Create movie object matching TypeScript interface
         movie = {
@@ -66,9 +51,11 @@ with open('outputs/vimeo_movies_ai_enhanced.csv', 'r', encoding='utf-8') as f:
 
         movies.append(movie)
 
-# Save to JSON (outputs folder is the Vite publicDir)
+# Save to JSON (outputs folder is the Vite publicDir). Compact one-shot
+# dumps() goes through the C encoder; json.dump() with indent does not,
+# and the browser doesn't need the whitespace.
 with open('outputs/ai_enhanced_movies.json', 'w', encoding='utf-8') as f:
-    json.dump(movies, f, indent=2, ensure_ascii=False)
+    f.write(json.dumps(movies, separators=(',', ':'), ensure_ascii=False))
 
 print(f"✅ Converted {len(movies)} movies to JSON")
 print(f"   Saved to: outputs/ai_enhanced_movies.json")
@@ -0,0 +1,78 @@
+"""
+Response Cache
+==============
+SQLite-backed cache of API responses shared by the pipeline's verifiers.
+
+Responses are keyed by a SHA-256 of everything that determines them (model,
+prompt, parameters, ...), so a rerun over the same videos is answered from
+disk instead of calling Claude or TMDb again.
+"""
+
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+
+class LLMCache:
+    """On-disk cache of API responses, keyed by a hash of the request."""
+
+    def __init__(self, path: str, ttl_days: Optional[float] = None):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite file to store responses in
+            ttl_days: Ignore entries older than this many days
+                (None keeps them forever)
+        """
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets other processes read while a write is in progress
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+        # Calls run on worker threads, so access is serialized
+        self._lock = threading.Lock()
+        self.ttl_seconds = ttl_days * 86400 if ttl_days is not None else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """SHA-256 of the request parts, which must fully determine the response."""
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key`, or None on a miss."""
+        oldest = time.time() - self.ttl_seconds if self.ttl_seconds is not None else 0
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM cache WHERE key = ? AND ts >= ?", (key, oldest)
+            ).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+            self._conn.commit()
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit and miss counts since the cache was opened."""
+        return {"hits": self.hits, "misses": self.misses}
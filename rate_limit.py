@@ -0,0 +1,59 @@
+"""
+Rate Limiting
+=============
+Token bucket shared by the pipeline's API clients (Vimeo, Claude, TMDb).
+
+Unlike a fixed sleep between calls, a bucket lets requests through at once
+while quota remains and only blocks once it is used up.
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces how fast requests are started."""
+
+    def __init__(self, requests: float, per_seconds: float = 60):
+        """
+        Create a full bucket.
+
+        Args:
+            requests: Requests allowed per window (also the burst size)
+            per_seconds: Window length in seconds
+        """
+        self.per_seconds = per_seconds
+        self.capacity = float(requests)
+        self.rate = self.capacity / per_seconds  # tokens per second
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def update(self, limit: Optional[str] = None, remaining: Optional[str] = None):
+        """
+        Sync with the quota a server reports (e.g. from rate limit headers).
+
+        Args:
+            limit: Requests allowed per window, replacing the current limit
+            remaining: Requests left in the current window
+        """
+        with self._lock:
+            if limit:
+                self.capacity = float(limit)
+                self.rate = self.capacity / self.per_seconds
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
@@ -5,6 +5,7 @@ Choose your preferred method to search for old movies
 """
 
 import sys
+import importlib
 import subprocess
 import os
 
@@ -101,13 +102,20 @@ def show_setup_help():
     input("Press Enter to return to menu...")
 
 def run_script(script_name):
-    """Run a Python script"""
+    """Run a script's main() in this process (a subprocess if it can't be imported)"""
     print(f"\n🚀 Launching {script_name}...")
     print("-" * 70)
     print()
     
     try:
-        subprocess.run([sys.executable, script_name], check=True)
+        try:
+            # Imported modules stay loaded, so later runs skip the import cost
+            module = importlib.import_module(os.path.splitext(script_name)[0])
+        except ImportError as e:
+            print(f"⚠️  Could not import {script_name} ({e}), running it separately")
+            subprocess.run([sys.executable, script_name], check=True)
+        else:
+            module.main()
     except subprocess.CalledProcessError as e:
         print(f"\n❌ Error running script: {e}")
     except FileNotFoundError:
@@ -115,6 +123,10 @@ def run_script(script_name):
         print("   Make sure all files are in the same directory.")
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
+    except SystemExit:
+        pass
+    except Exception as e:
+        print(f"\n❌ Error running script: {e}")
     
     print()
     input("Press Enter to return to menu...")
@@ -8,21 +8,54 @@ import requests
 import csv
 import json
 import os
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limit import TokenBucket
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Vimeo API response fields that search_videos reads
+VIDEO_FIELDS = ",".join((
+    "name", "link", "description", "duration", "created_time", "stats.plays",
+    "metadata.connections.likes.total", "metadata.connections.comments.total",
+    "user.name", "user.link", "tags.name", "categories.name",
+))
+# Largest page size the Vimeo API accepts
+MAX_PER_PAGE = 100
+# Pages of one query fetched at once (the rate limiter still paces them)
+PAGE_FETCH_WORKERS = 4
+
+
+# Durations repeat a lot across videos and the range is small, so the
+# formatted strings are memoized
+@lru_cache(maxsize=4096)
+def format_duration(seconds: int) -> str:
+    """Format duration in seconds to HH:MM:SS (MM:SS under an hour)"""
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes:02d}:{secs:02d}"
+
+
 class VimeoMovieFinder:
-    def __init__(self, access_token: str = None):
+    def __init__(self, access_token: str = None, requests_per_minute: int = 60):
         """
         Initialize the Vimeo finder
         
         Args:
             access_token: Vimeo API access token (get from https://developer.vimeo.com/)
+            requests_per_minute: Request rate shared by all searches (and
+                threads) using this finder
         """
         self.access_token = access_token
         self.base_url = "https://api.vimeo.com"
@@ -30,14 +63,89 @@ class VimeoMovieFinder:
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/vnd.vimeo.*+json;version=3.4"
         } if access_token else {}
+        # Parts of every search request that don't change between calls
+        self._search_url = f"{self.base_url}/videos"
+        self._base_params = {
+            "sort": "relevant",
+            "filter": "CC",  # Creative Commons filter for old/public domain content
+            # Only return the fields _parse_video reads; full video objects
+            # (pictures, embed HTML, files...) are many times larger
+            "fields": VIDEO_FIELDS
+        }
+        # Keep-alive session so pages and queries reuse one connection;
+        # rate limits and server errors are retried with backoff
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET"})
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        )
+        # Be nice to the API: blocks only once the per-minute budget is spent
+        self.rate_limiter = TokenBucket(requests_per_minute)
         
-    def search_videos(self, query: str, per_page: int = 50, max_results: int = 50) -> List[Dict]:
+    def _fetch_page(self, query: str, page: int, per_page: int) -> Optional[Dict]:
+        """Fetch one page of search results (None if the request failed)"""
+        params = {**self._base_params, "query": query, "per_page": per_page, "page": page}
+
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(self._search_url, params=params)
+        except Exception as e:
+            print(f"❌ Error during search: {e}")
+            return None
+
+        if response.status_code == 401:
+            print("❌ Authentication failed. Please check your API token.")
+            return None
+        elif response.status_code != 200:
+            print(f"❌ API request failed with status {response.status_code}")
+            return None
+
+        return response.json()
+
+    @staticmethod
+    def _parse_video(video: Dict) -> Dict:
+        """Flatten one Vimeo API video object into our video dict"""
+        # Extract tags
+        tags = []
+        if video.get("tags"):
+            tags = [tag.get("name", "") for tag in video.get("tags", [])]
+
+        # Extract categories
+        categories = []
+        if video.get("categories"):
+            categories = [cat.get("name", "") for cat in video.get("categories", [])]
+
+        return {
+            "title": video.get("name", "Untitled"),
+            "url": video.get("link", ""),
+            # Full description only; display code truncates it as needed
+            "description": video.get("description") or "",
+            "duration": video.get("duration", 0),
+            "duration_formatted": format_duration(video.get("duration", 0)),
+            "created_date": video.get("created_time", ""),
+            "views": video.get("stats", {}).get("plays", 0),
+            "likes": video.get("metadata", {}).get("connections", {}).get("likes", {}).get("total", 0),
+            "comments": video.get("metadata", {}).get("connections", {}).get("comments", {}).get("total", 0),
+            "user": video.get("user", {}).get("name", "Unknown"),
+            "user_url": video.get("user", {}).get("link", ""),
+            "tags": tags,
+            "categories": categories,
+        }
+
+    def search_videos(self, query: str, per_page: int = 100, max_results: int = 50) -> List[Dict]:
         """
         Search for videos on Vimeo
         
         Args:
             query: Search query
-            per_page: Results per page
+            per_page: Results per page (Vimeo allows at most 100)
             max_results: Maximum number of results to return
             
         Returns:
@@ -47,113 +155,56 @@ class VimeoMovieFinder:
             print("⚠️  No API token provided. Please get one from https://developer.vimeo.com/")
             return []
         
-        videos = []
-        page = 1
-        
+        # Every page must have the same size for page numbers to line up
+        per_page = max(1, min(per_page, MAX_PER_PAGE, max_results))
+
         print(f"🔍 Searching Vimeo for: '{query}'...")
-        
-        while len(videos) < max_results:
-            try:
-                url = f"{self.base_url}/videos"
-                params = {
-                    "query": query,
-                    "per_page": min(per_page, max_results - len(videos)),
-                    "page": page,
-                    "sort": "relevant",
-                    "filter": "CC"  # Creative Commons filter for old/public domain content
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params)
-                
-                if response.status_code == 401:
-                    print("❌ Authentication failed. Please check your API token.")
-                    break
-                elif response.status_code != 200:
-                    print(f"❌ API request failed with status {response.status_code}")
-                    break
-                
-                data = response.json()
-                
-                if not data.get("data"):
-                    print(f"✓ No more results found. Got {len(videos)} videos total.")
-                    break
-                
-                for video in data["data"]:
-                    # Extract tags
-                    tags = []
-                    if video.get("tags"):
-                        tags = [tag.get("name", "") for tag in video.get("tags", [])]
-
-                    # Extract categories
-                    categories = []
-                    if video.get("categories"):
-                        categories = [cat.get("name", "") for cat in video.get("categories", [])]
-
-                    videos.append({
-                        "title": video.get("name", "Untitled"),
-                        "url": video.get("link", ""),
-                        "description": video.get("description", "") if video.get("description") else "",  # Full description
-                        "description_short": video.get("description", "")[:200] if video.get("description") else "",  # Truncated for display
-                        "duration": video.get("duration", 0),
-                        "duration_formatted": self._format_duration(video.get("duration", 0)),
-                        "created_date": video.get("created_time", ""),
-                        "views": video.get("stats", {}).get("plays", 0),
-                        "likes": video.get("metadata", {}).get("connections", {}).get("likes", {}).get("total", 0),
-                        "comments": video.get("metadata", {}).get("connections", {}).get("comments", {}).get("total", 0),
-                        "user": video.get("user", {}).get("name", "Unknown"),
-                        "user_url": video.get("user", {}).get("link", ""),
-                        "tags": tags,
-                        "categories": categories,
-                    })
-                    
-                    if len(videos) >= max_results:
-                        break
-                
-                print(f"  Found {len(videos)}/{max_results} videos...")
-                
-                # Check if there are more pages
-                if not data.get("paging", {}).get("next"):
-                    break
-                    
-                page += 1
-                time.sleep(0.5)  # Be nice to the API
-                
-            except Exception as e:
-                print(f"❌ Error during search: {e}")
-                break
-        
-        return videos[:max_results]
+
+        first = self._fetch_page(query, 1, per_page)
+        if not first:
+            return []
+        if not first.get("data"):
+            print("✓ No results found.")
+            return []
+        pages = [first]
+
+        # The first page reports the total, so the remaining pages can be
+        # requested at once instead of following "next" links one by one
+        if first.get("paging", {}).get("next"):
+            total = min(first.get("total") or max_results, max_results)
+            last_page = -(-total // per_page)
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                    rest = executor.map(
+                        lambda page: self._fetch_page(query, page, per_page),
+                        range(2, last_page + 1)
+                    )
+                    # Stop at the first failed or empty page, as serial paging did
+                    for data in rest:
+                        if not data or not data.get("data"):
+                            break
+                        pages.append(data)
+
+        videos = [self._parse_video(video) for data in pages for video in data["data"]][:max_results]
+        print(f"  Found {len(videos)}/{max_results} videos...")
+
+        return videos
     
     def search_multiple_queries(self, queries: List[str], per_query: int = 10) -> List[Dict]:
         """
         Search multiple queries and combine results
         """
-        all_videos = []
-        seen_urls = set()
+        # Dicts keep insertion order, so the first video seen per URL wins
+        videos_by_url: Dict[str, Dict] = {}
         
         for query in queries:
             videos = self.search_videos(query, per_page=per_query, max_results=per_query)
             
             # Deduplicate
             for video in videos:
-                if video["url"] not in seen_urls:
-                    all_videos.append(video)
-                    seen_urls.add(video["url"])
-            
-            time.sleep(1)  # Rate limiting
-        
-        return all_videos
-    
-    def _format_duration(self, seconds: int) -> str:
-        """Format duration in seconds to HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+                videos_by_url.setdefault(video["url"], video)
         
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return list(videos_by_url.values())
     
     def save_to_csv(self, videos: List[Dict], filename: str = "vimeo_old_movies.csv"):
         """Save videos to CSV file"""
@@ -170,10 +221,13 @@ class VimeoMovieFinder:
 
         output_path = os.path.join(output_dir, filename)
 
+        # Plain rows in a fixed column order are cheaper than DictWriter's
+        # per-row dict handling
+        fieldnames = list(videos[0])
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=videos[0].keys())
-            writer.writeheader()
-            writer.writerows(videos)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows([video.get(k, '') for k in fieldnames] for video in videos)
 
         print(f"✅ Saved {len(videos)} videos to {output_path}")
         return output_path
@@ -193,8 +247,10 @@ class VimeoMovieFinder:
 
         output_path = os.path.join(output_dir, filename)
 
+        # Compact one-shot dumps() goes through the C encoder; json.dump()
+        # with indent does not
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(videos, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(videos, separators=(',', ':'), ensure_ascii=False))
 
         print(f"✅ Saved {len(videos)} videos to {output_path}")
         return output_path
@@ -5,20 +5,129 @@ Scrapes Vimeo search results for old movies
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import csv
+import io
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, quote
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional
 import re
 
+from rate_limit import TokenBucket
+
+# Structured data (schema.org JSON-LD) embedded in the page
+LD_JSON_RE = re.compile(rb'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.S)
+# Numeric video id in an absolute Vimeo URL
+VIDEO_URL_ID_RE = re.compile(r'vimeo\.com/(?:video/)?(\d{6,})')
+# ISO 8601 durations as used by schema.org, e.g. "PT1H23M45S"
+ISO_DURATION_RE = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# BeautifulSoup on lxml's C parser is several times faster than on the
+# pure-Python html.parser; lxml is optional, so fall back without it
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def is_video_href(href: Optional[str]) -> bool:
+    """True for a relative link to a video page (e.g. /123456789)"""
+    # Plain string checks: one C-level scan each, no regex engine
+    if not href or not href.startswith('/'):
+        return False
+    video_id = href[1:].rstrip('/')
+    return len(video_id) > 5 and video_id.isascii() and video_id.isdigit()
+
+
+# Tag filter for search pages, built once instead of per page
+VIDEO_LINK_STRAINER = SoupStrainer('a', href=is_video_href)
+
+
+def parse_iso_duration(value: str) -> Optional[int]:
+    """Convert an ISO 8601 duration ("PT1H23M45S") to seconds (None if invalid)"""
+    match = ISO_DURATION_RE.match(value or '')
+    if not match or not any(match.groups()):
+        return None
+    days, hours, minutes, seconds = (int(g) if g else 0 for g in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def _iter_video_objects(data) -> Iterator[Dict]:
+    """Yield every schema.org VideoObject in a JSON-LD document"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_video_objects(item)
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        if types == 'VideoObject' or (isinstance(types, list) and 'VideoObject' in types):
+            yield data
+            return
+        # Search pages list results as ItemList -> ListItem -> item
+        for key in ('@graph', 'itemListElement', 'item'):
+            if key in data:
+                yield from _iter_video_objects(data[key])
+
+
 class VimeoScraper:
-    def __init__(self):
+    def __init__(self, requests_per_minute: int = 30, max_workers: int = 4):
+        """
+        Initialize the scraper
+
+        Args:
+            requests_per_minute: Page fetches allowed per minute, shared by
+                all queries (and threads) using this scraper
+            max_workers: Number of queries scraped at once
+        """
         self.base_url = "https://vimeo.com"
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8',
+            # Compressed pages are several times smaller on the wire. Only
+            # encodings this install can decode are offered (br needs brotli).
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING
         }
+        # Be respectful with scraping: one budget for every request, instead
+        # of fixed sleeps that also stall queries running in parallel
+        self.rate_limiter = TokenBucket(requests_per_minute)
+        self.max_workers = max_workers
+        # Details already fetched, by video id (overlapping queries and
+        # batches ask for the same videos again)
+        self._details_cache: Dict[str, Dict] = {}
+        # Keep-alive session so every page reuses a pooled connection instead
+        # of a new TCP + TLS handshake; throttling and server errors are retried
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+    
+    def _get_with_backoff(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        GET a page at the shared rate, backing off only when Vimeo asks.
+
+        No fixed delay is added on the happy path. 429s and 5xx responses are
+        retried by the session's adapter with exponential backoff, waiting
+        out Retry-After when it is sent. A reported remaining quota caps the
+        shared limiter, so other workers slow down too.
+        """
+        self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, timeout=10)
+        # The limit's window isn't reported, so only the remaining count is used
+        self.rate_limiter.update(remaining=response.headers.get('X-RateLimit-Remaining'))
+        return response
     
     def search_videos(self, query: str, max_results: int = 50) -> List[Dict]:
         """
@@ -32,55 +141,45 @@ class VimeoScraper:
             List of video dictionaries
         """
         videos = []
+        seen_ids = set()
         page = 1
         
         print(f"🔍 Searching Vimeo for: '{query}'...")
         print("⚠️  Note: Web scraping may be limited. Consider using the API version for better results.")
         
+        # Bound once: the per-link loop below is the scraper's hot path
+        append = videos.append
+        seen_add = seen_ids.add
+        
         while len(videos) < max_results:
             try:
                 # Vimeo search URL
                 search_url = f"{self.base_url}/search?q={quote(query)}&page={page}"
                 
                 print(f"  Fetching page {page}...")
-                response = requests.get(search_url, headers=self.headers, timeout=10)
+                response = self._get_with_backoff(search_url)
                 
                 if response.status_code != 200:
                     print(f"  ⚠️  Status code {response.status_code}, stopping...")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # The embedded JSON-LD is cheaper to parse than the DOM and
+                # has the details links lack; scrape links only without it
+                page_videos = self._videos_from_ld_json(response.content) or self._videos_from_links(response.content)
                 
-                # Find video links (this is approximate and may need adjustment)
-                # Vimeo's structure may change, so this is a best-effort approach
-                video_links = soup.find_all('a', href=re.compile(r'^/\d+'))
-                
-                if not video_links:
+                if not page_videos:
                     print(f"  No more videos found on page {page}")
                     break
                 
-                for link in video_links:
-                    if len(videos) >= max_results:
-                        break
-                    
-                    video_id = link.get('href', '').strip('/')
-                    if video_id.isdigit() and len(video_id) > 5:
-                        video_url = f"{self.base_url}/{video_id}"
-                        
-                        # Try to get title from the link text or nearby elements
-                        title = link.get_text(strip=True) or link.get('title', '') or f"Video {video_id}"
-                        
-                        # Check for duplicates
-                        if not any(v['url'] == video_url for v in videos):
-                            videos.append({
-                                "title": title,
-                                "url": video_url,
-                                "video_id": video_id,
-                                "description": "",
-                                "duration": "",
-                                "views": "",
-                                "user": ""
-                            })
+                for video in page_videos:
+                    # Check for duplicates
+                    video_id = int(video["video_id"])
+                    if video_id not in seen_ids:
+                        seen_add(video_id)
+                        append(video)
+                        # Only an append can reach the limit, so check here
+                        if len(videos) == max_results:
+                            break
                 
                 print(f"  Found {len(videos)}/{max_results} videos so far...")
                 
@@ -88,7 +187,6 @@ class VimeoScraper:
                     break
                 
                 page += 1
-                time.sleep(2)  # Be respectful with scraping
                 
             except Exception as e:
                 print(f"  ❌ Error: {e}")
@@ -96,52 +194,175 @@ class VimeoScraper:
         
         return videos[:max_results]
     
+    def _videos_from_ld_json(self, content: bytes) -> List[Dict]:
+        """Videos described by the page's JSON-LD (empty if there is none)"""
+        videos = []
+        
+        for block in LD_JSON_RE.findall(content):
+            try:
+                data = json.loads(block)
+            except ValueError:
+                continue
+            
+            for obj in _iter_video_objects(data):
+                match = VIDEO_URL_ID_RE.search(obj.get('url') or obj.get('embedUrl') or '')
+                if not match:
+                    continue
+                video_id = match.group(1)
+                
+                views = ""
+                stats = obj.get('interactionStatistic') or []
+                for stat in stats if isinstance(stats, list) else [stats]:
+                    if not isinstance(stat, dict):
+                        continue
+                    # "WatchAction", a schema.org URL or {"@type": "WatchAction"}
+                    action = stat.get('interactionType') or ''
+                    if isinstance(action, dict):
+                        action = action.get('@type', '')
+                    if str(action).endswith('WatchAction'):
+                        views = stat.get('userInteractionCount', "")
+                        break
+                
+                author = obj.get('author') or {}
+                if isinstance(author, list):
+                    author = author[0] if author else {}
+                
+                duration = parse_iso_duration(obj.get('duration', ''))
+                
+                videos.append({
+                    "title": obj.get('name') or f"Video {video_id}",
+                    "url": f"{self.base_url}/{video_id}",
+                    "video_id": video_id,
+                    "description": obj.get('description') or "",
+                    "duration": duration if duration is not None else "",
+                    "views": views,
+                    "user": author.get('name', "") if isinstance(author, dict) else ""
+                })
+        
+        return videos
+    
+    def _videos_from_links(self, content: bytes) -> List[Dict]:
+        """Videos linked from the page, with only their title known"""
+        # Only links that look like video links are built into the tree;
+        # every other tag is tokenized and dropped
+        # Vimeo serves UTF-8, so the bytes are decoded without running
+        # charset detection over the whole page first (as response.text does)
+        soup = BeautifulSoup(
+            content, HTML_PARSER,
+            parse_only=VIDEO_LINK_STRAINER,
+            from_encoding='utf-8'
+        )
+        videos = []
+        append = videos.append
+        base_url = self.base_url
+        
+        # Find video links (this is approximate and may need adjustment)
+        # Vimeo's structure may change, so this is a best-effort approach
+        for link in soup.find_all('a'):
+            # The strainer already kept only valid video links
+            video_id = link['href'][1:].rstrip('/')
+            
+            # Try to get title from the link text or nearby elements
+            title = link.get_text(strip=True) or link.get('title', '') or f"Video {video_id}"
+            
+            append({
+                "title": title,
+                "url": f"{base_url}/{video_id}",
+                "video_id": video_id,
+                "description": "",
+                "duration": "",
+                "views": "",
+                "user": ""
+            })
+        
+        return videos
+    
     def get_video_details(self, video_id: str) -> Dict:
         """
         Get detailed information about a specific video
         """
+        video_id = str(video_id)
+        cached = self._details_cache.get(video_id)
+        if cached is not None:
+            return cached
+        
         try:
-            url = f"{self.base_url}/{video_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            # oEmbed answers with a small JSON document instead of the full
+            # video page, so there is no HTML to download or parse
+            response = self._get_with_backoff(
+                f"{self.base_url}/api/oembed.json",
+                params={"url": f"{self.base_url}/{video_id}"}
+            )
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Try to extract title and other info
-                title_tag = soup.find('h1')
-                title = title_tag.get_text(strip=True) if title_tag else ""
-                
-                # Try to find description
-                desc_tag = soup.find('meta', {'name': 'description'})
-                description = desc_tag.get('content', '') if desc_tag else ""
-                
-                return {
-                    "title": title,
-                    "description": description
+                data = response.json()
+                details = {
+                    "title": data.get("title", ""),
+                    "description": data.get("description", ""),
+                    "duration": data.get("duration", ""),
+                    "user": data.get("author_name", "")
                 }
+                # Failures aren't cached, so a later call can retry them
+                self._details_cache[video_id] = details
+                return details
         except Exception as e:
             print(f"  Error fetching details for {video_id}: {e}")
         
         return {}
     
+    def get_video_details_batch(self, video_ids: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Get details for many videos at once
+        
+        Detail pages are pure network wait, so they are fetched concurrently
+        (still paced by the shared rate limiter).
+        
+        Returns:
+            One details dict per video id, in the same order ({} on failure)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(self.get_video_details, video_ids))
+    
+    def validate_urls(self, urls: List[str], max_workers: int = 16) -> Dict[str, Optional[int]]:
+        """
+        Check which video URLs are still live
+        
+        HEAD requests skip the page body, and run concurrently so the checks
+        overlap their network waits (still paced by the shared rate limiter).
+        
+        Returns:
+            Final HTTP status code per URL (None if the request failed)
+        """
+        def status(url: str) -> Optional[int]:
+            try:
+                self.rate_limiter.acquire()
+                return self.session.head(url, timeout=5, allow_redirects=True).status_code
+            except requests.exceptions.RequestException:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return dict(zip(urls, executor.map(status, urls)))
+    
     def search_multiple_queries(self, queries: List[str], per_query: int = 10) -> List[Dict]:
         """
         Search multiple queries and combine results
         """
         all_videos = []
-        seen_urls = set()
+        seen_ids = set()
         
-        for query in queries:
-            print()
-            videos = self.search_videos(query, max_results=per_query)
-            
-            # Deduplicate
-            for video in videos:
-                if video["url"] not in seen_urls:
-                    all_videos.append(video)
-                    seen_urls.add(video["url"])
+        # Scraping is pure network wait, so several queries run at once; the
+        # shared rate limiter keeps the overall request rate polite.
+        # map() keeps results in query order so deduplication stays stable.
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            results = executor.map(lambda query: self.search_videos(query, max_results=per_query), queries)
             
-            time.sleep(3)  # Rate limiting
+            for videos in results:
+                # Deduplicate
+                for video in videos:
+                    video_id = int(video["video_id"])
+                    if video_id not in seen_ids:
+                        all_videos.append(video)
+                        seen_ids.add(video_id)
         
         return all_videos
     
@@ -160,10 +381,16 @@ class VimeoScraper:
 
         output_path = os.path.join(output_dir, filename)
 
+        # Plain rows in a fixed column order are cheaper than DictWriter's
+        # per-row dict handling. Rows are staged in memory, so the file gets
+        # one encode and one write instead of many small ones.
+        fieldnames = list(videos[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        writer.writerows([video.get(k, '') for k in fieldnames] for video in videos)
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=videos[0].keys())
-            writer.writeheader()
-            writer.writerows(videos)
+            f.write(buffer.getvalue())
 
         print(f"✅ Saved {len(videos)} videos to {output_path}")
         return output_path